@@ -56,10 +56,12 @@ class Config:
     # Chat core settings
     CHAT_CONFIG = {
         "max_conversation_history": 10,
+        "max_active_conversations": 10000,
         "default_response_style": "balanced",
         "default_personality": "balanced",
         "enable_suggestions": True,
-        "suggestion_count": 3
+        "suggestion_count": 3,
+        "enable_fast_ack": True  # Answer greetings/acknowledgments without full reasoning
     }
     
     # AI Services settings
@@ -68,7 +70,9 @@ class Config:
         "max_retries": 3,
         "rate_limit_buffer": 0.8,  # Use 80% of rate limit
         "cost_tracking": True,
-        "prefer_free_services": True
+        "prefer_free_services": True,
+        "http2": False,  # Multiplex non-streaming calls over httpx HTTP/2 (requires httpx[http2])
+        "cache_semantic": False  # Also reuse answers for prompts differing only in case/punctuation
     }
     
     # Reflector settings
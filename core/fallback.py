@@ -3,6 +3,7 @@ Mythiq AI - Advanced Fallback and Resilience System
 Smart AI service routing, circuit breakers, retry logic, and graceful degradation
 """
 
+import re
 import time
 import asyncio
 import random
@@ -14,6 +15,34 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Keyword ladders for the built-in fallbacks, each scanned in one pass over lowercased text
+_CHAT_GREETING_RE = re.compile("hello|hi|hey")
+_CHAT_QUESTION_RE = re.compile("how|what|why|when|where")
+_CHAT_CREATIVE_RE = re.compile("create|make|generate|build")
+_CHAT_NEGATIVE_RE = re.compile("sad|angry|frustrated|upset")
+_CHAT_POSITIVE_RE = re.compile("happy|excited|great|awesome")
+_CHAT_DEFAULT_REPLIES = (
+    "Thanks for sharing '{message}' with me! I'm always learning and improving to help you better! 🚀",
+    "I hear you saying '{message}'. While I'm getting smarter, I'm here to support you however I can! 💫",
+    "Your message '{message}' is important to me. I'm working on understanding you better every day! 🧠"
+)
+
+_EMOTION_KEYWORDS = (
+    ("joy", re.compile("happy|joy|excited|great|awesome|love|wonderful")),
+    ("sadness", re.compile("sad|depressed|down|unhappy|crying")),
+    ("anger", re.compile("angry|mad|furious|hate|annoyed")),
+    ("fear", re.compile("scared|afraid|worried|anxious|nervous"))
+)
+
+# (intent, confidence, keywords) in priority order
+_INTENT_KEYWORDS = (
+    ("creative_request", 0.8, re.compile("create|make|generate|build|design")),
+    ("information_request", 0.7, re.compile("help|how|what|explain|tell me")),
+    ("greeting", 0.9, re.compile("hello|hi|hey|greetings")),
+    ("farewell", 0.9, re.compile("bye|goodbye|see you|farewell")),
+    ("gratitude", 0.8, re.compile("thanks|thank you|appreciate"))
+)
+
 class ServiceStatus(Enum):
     """Service status enumeration."""
     HEALTHY = "healthy"
@@ -387,23 +416,19 @@ class FallbackManager:
         # Simple pattern-based responses
         message_lower = message.lower()
         
-        if any(word in message_lower for word in ["hello", "hi", "hey"]):
+        if _CHAT_GREETING_RE.search(message_lower):
             response = "Hello! I'm Mythiq AI. I'm here to help you create amazing things! 🌟"
-        elif any(word in message_lower for word in ["how", "what", "why", "when", "where"]):
+        elif _CHAT_QUESTION_RE.search(message_lower):
             response = f"That's a great question about '{message}'. I'm processing your request and will have better answers soon! 🤔"
-        elif any(word in message_lower for word in ["create", "make", "generate", "build"]):
+        elif _CHAT_CREATIVE_RE.search(message_lower):
             response = f"I'd love to help you create something amazing! Your idea about '{message}' sounds fantastic! 🎨"
-        elif any(word in message_lower for word in ["sad", "angry", "frustrated", "upset"]):
+        elif _CHAT_NEGATIVE_RE.search(message_lower):
             response = "I understand you might be feeling down. I'm here to support you and help make things better! 💝"
-        elif any(word in message_lower for word in ["happy", "excited", "great", "awesome"]):
+        elif _CHAT_POSITIVE_RE.search(message_lower):
             response = "I love your positive energy! Let's channel that excitement into creating something wonderful! 🎉"
         else:
-            responses = [
-                f"Thanks for sharing '{message}' with me! I'm always learning and improving to help you better! 🚀",
-                f"I hear you saying '{message}'. While I'm getting smarter, I'm here to support you however I can! 💫",
-                f"Your message '{message}' is important to me. I'm working on understanding you better every day! 🧠"
-            ]
-            response = random.choice(responses)
+            # Pick the template first so only the chosen reply is formatted
+            response = random.choice(_CHAT_DEFAULT_REPLIES).format(message=message)
         
         return {
             "response": response,
@@ -454,21 +479,10 @@ class FallbackManager:
         
         text_lower = text.lower()
         
-        # Joy indicators
-        if any(word in text_lower for word in ["happy", "joy", "excited", "great", "awesome", "love", "wonderful"]):
-            emotions["joy"] = 0.8
-        
-        # Sadness indicators
-        if any(word in text_lower for word in ["sad", "depressed", "down", "unhappy", "crying"]):
-            emotions["sadness"] = 0.8
-        
-        # Anger indicators
-        if any(word in text_lower for word in ["angry", "mad", "furious", "hate", "annoyed"]):
-            emotions["anger"] = 0.8
-        
-        # Fear indicators
-        if any(word in text_lower for word in ["scared", "afraid", "worried", "anxious", "nervous"]):
-            emotions["fear"] = 0.8
+        # Joy, sadness, anger and fear indicators
+        for emotion, keywords_re in _EMOTION_KEYWORDS:
+            if keywords_re.search(text_lower):
+                emotions[emotion] = 0.8
         
         # Default to neutral if no strong emotions detected
         if max(emotions.values()) < 0.5:
@@ -490,27 +504,16 @@ class FallbackManager:
         text_lower = text.lower()
         
         # Simple intent classification
-        if any(word in text_lower for word in ["create", "make", "generate", "build", "design"]):
-            intent = "creative_request"
-            confidence = 0.8
-        elif any(word in text_lower for word in ["help", "how", "what", "explain", "tell me"]):
-            intent = "information_request"
-            confidence = 0.7
-        elif any(word in text_lower for word in ["hello", "hi", "hey", "greetings"]):
-            intent = "greeting"
-            confidence = 0.9
-        elif any(word in text_lower for word in ["bye", "goodbye", "see you", "farewell"]):
-            intent = "farewell"
-            confidence = 0.9
-        elif any(word in text_lower for word in ["thanks", "thank you", "appreciate"]):
-            intent = "gratitude"
-            confidence = 0.8
-        elif "?" in text:
-            intent = "question"
-            confidence = 0.6
+        for intent, confidence, keywords_re in _INTENT_KEYWORDS:
+            if keywords_re.search(text_lower):
+                break
         else:
-            intent = "general_chat"
-            confidence = 0.5
+            if "?" in text:
+                intent = "question"
+                confidence = 0.6
+            else:
+                intent = "general_chat"
+                confidence = 0.5
         
         return {
             "intent": intent,
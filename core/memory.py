@@ -140,27 +140,35 @@ class MemoryManager:
     
     def add_message_to_conversation(self, conversation_id: str, message: Dict[str, Any]) -> bool:
         """Add message to conversation memory."""
+        return self.add_messages_to_conversation(conversation_id, [message])
+    
+    def add_messages_to_conversation(self, conversation_id: str, messages: List[Dict[str, Any]]) -> bool:
+        """Add a batch of messages (e.g. a user/assistant turn) to conversation memory."""
         if conversation_id not in self.conversations:
             logger.warning(f"Conversation {conversation_id} not found")
             return False
         
         conversation = self.conversations[conversation_id]
-        conversation.messages.append({
-            **message,
-            "timestamp": datetime.now().isoformat()
-        })
-        conversation.updated_at = datetime.now().isoformat()
-        
-        # Extract topics and emotions if present
-        if "detected_topics" in message:
-            for topic in message["detected_topics"]:
-                if topic not in conversation.topics:
-                    conversation.topics.append(topic)
-        
-        if "detected_emotions" in message:
-            conversation.emotional_journey.append(message["detected_emotions"])
-        
-        logger.debug(f"Added message to conversation {conversation_id}")
+        timestamp = datetime.now().isoformat()
+        
+        for message in messages:
+            conversation.messages.append({
+                **message,
+                "timestamp": timestamp
+            })
+            
+            # Extract topics and emotions if present
+            if "detected_topics" in message:
+                for topic in message["detected_topics"]:
+                    if topic not in conversation.topics:
+                        conversation.topics.append(topic)
+            
+            if "detected_emotions" in message:
+                conversation.emotional_journey.append(message["detected_emotions"])
+        
+        conversation.updated_at = timestamp
+        
+        logger.debug(f"Added {len(messages)} message(s) to conversation {conversation_id}")
         return True
     
     def get_conversation_context(self, conversation_id: str, max_messages: int = 10) -> Dict[str, Any]:
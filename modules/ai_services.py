@@ -4,17 +4,54 @@ Coordinates OpenAI, Claude, and Groq APIs with intelligent routing and fallback
 """
 
 import os
+import time
 import asyncio
+import hashlib
+import contextlib
+import threading
+import functools
+import itertools
 import aiohttp
 import json
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
-from datetime import datetime
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, asdict, field, replace
+from collections import OrderedDict
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+    import h2  # noqa: F401  # httpx only speaks HTTP/2 with the h2 package (httpx[http2])
+except ImportError:
+    httpx = None
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+def _json_dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    """Serialize to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS if sort_keys else None)
+    return json.dumps(obj, default=str, sort_keys=sort_keys).encode()
+
+@functools.lru_cache(maxsize=32)
+def _system_message(personality: Optional[str]) -> str:
+    """Build the system message for an AI personality."""
+    system_message = "You are Mythiq AI, an emotionally intelligent and creative AI assistant."
+    if personality:
+        system_message += f" You are currently in {personality} mode."
+    return system_message
+
+def _json_loads(data: Any) -> Any:
+    """Deserialize JSON bytes or text, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+@dataclass(slots=True)
 class AIServiceConfig:
     """Configuration for an AI service."""
     name: str
@@ -27,8 +64,29 @@ class AIServiceConfig:
     rate_limit_per_minute: int
     cost_per_1k_tokens: float
     priority: int  # Lower number = higher priority
+    headers: Optional[Dict[str, str]] = None
+    endpoint: Optional[str] = None
+    
+    def __post_init__(self):
+        if self.name == "claude":
+            if self.headers is None:
+                self.headers = {
+                    "Content-Type": "application/json",
+                    "x-api-key": self.api_key,
+                    "anthropic-version": "2023-06-01"
+                }
+            if self.endpoint is None:
+                self.endpoint = f"{self.base_url}/messages"
+        else:  # OpenAI-compatible (OpenAI, Groq)
+            if self.headers is None:
+                self.headers = {
+                    "Content-Type": "application/json",
+                    "Authorization": f"Bearer {self.api_key}"
+                }
+            if self.endpoint is None:
+                self.endpoint = f"{self.base_url}/chat/completions"
 
-@dataclass
+@dataclass(slots=True)
 class AIServiceResponse:
     """Response from an AI service."""
     success: bool
@@ -39,7 +97,122 @@ class AIServiceResponse:
     response_time: float
     cost: float
     error_message: Optional[str] = None
-    metadata: Dict[str, Any] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+class ResponseCache:
+    """Two-level cache of successful AI responses.
+    
+    L1 matches the exact prompt and conversation context. L2 matches
+    context-free prompts that differ only in case, whitespace and trailing
+    punctuation, so word order and negation always change the key.
+    """
+    
+    def __init__(self, max_size: int = 10000, ttl: float = 3600.0, max_semantic_entries: int = 512):
+        """Initialize response cache."""
+        self.max_size = max_size
+        self.ttl = ttl
+        self.max_semantic_entries = max_semantic_entries
+        
+        self.exact: OrderedDict = OrderedDict()  # key -> (expires_at, response)
+        self.semantic: OrderedDict = OrderedDict()  # normalized key -> (expires_at, response)
+        
+        self.hits = {"L1": 0, "L2": 0}
+        self.misses = 0
+    
+    @staticmethod
+    def _preference_key(preferences: Dict[str, Any]) -> bytes:
+        """Serialize the preferences that shape routing and the response, ignoring cache controls."""
+        return _json_dumps(
+            {name: value for name, value in preferences.items() if name not in ("use_cache", "semantic_cache")},
+            sort_keys=True
+        )
+    
+    @staticmethod
+    def make_key(prompt: str, context: Dict[str, Any], preferences: Dict[str, Any]) -> bytes:
+        """Build the exact-match key for a prompt, its conversation context and preferences."""
+        key_data = {
+            "prompt": prompt,
+            "history": (context.get("conversation_history") or [])[-5:],
+            "personality": context.get("ai_personality"),
+            "preferences": ResponseCache._preference_key(preferences)
+        }
+        return hashlib.blake2b(_json_dumps(key_data, sort_keys=True), digest_size=16).digest()
+    
+    @staticmethod
+    def make_semantic_key(prompt: str, context: Dict[str, Any],
+                          preferences: Dict[str, Any]) -> Tuple[str, Optional[str], bytes]:
+        """Build the normalized key for a context-free prompt."""
+        normalized = " ".join(prompt.casefold().split()).rstrip(" ?!.")
+        return normalized, context.get("ai_personality"), ResponseCache._preference_key(preferences)
+    
+    def get(self, key: bytes, semantic_key: Optional[Tuple] = None) -> Optional[AIServiceResponse]:
+        """Look up a cached response, trying the exact layer before the normalized one."""
+        now = time.monotonic()
+        
+        entry = self.exact.get(key)
+        if entry is not None:
+            expires_at, response = entry
+            if expires_at > now:
+                self.exact.move_to_end(key)
+                self.hits["L1"] += 1
+                return self._as_cached(response, "L1")
+            del self.exact[key]
+        
+        if semantic_key is not None:
+            entry = self.semantic.get(semantic_key)
+            if entry is not None:
+                expires_at, response = entry
+                if expires_at > now:
+                    self.semantic.move_to_end(semantic_key)
+                    # Backfill L1 so the next identical prompt is an exact hit
+                    self._put_exact(key, response, now)
+                    self.hits["L2"] += 1
+                    return self._as_cached(response, "L2")
+                del self.semantic[semantic_key]
+        
+        self.misses += 1
+        return None
+    
+    def put(self, key: bytes, response: AIServiceResponse, semantic_key: Optional[Tuple] = None):
+        """Cache a successful response."""
+        now = time.monotonic()
+        self._put_exact(key, response, now)
+        
+        if semantic_key is not None:
+            self.semantic[semantic_key] = (now + self.ttl, response)
+            self.semantic.move_to_end(semantic_key)
+            
+            while len(self.semantic) > self.max_semantic_entries:
+                self.semantic.popitem(last=False)
+    
+    def _put_exact(self, key: bytes, response: AIServiceResponse, now: float):
+        """Insert into the exact layer, evicting least recently used entries."""
+        self.exact[key] = (now + self.ttl, response)
+        self.exact.move_to_end(key)
+        
+        while len(self.exact) > self.max_size:
+            self.exact.popitem(last=False)
+    
+    @staticmethod
+    def _as_cached(response: AIServiceResponse, layer: str) -> AIServiceResponse:
+        """Copy a cached response, marking where it came from."""
+        return replace(
+            response,
+            response_time=0.0,
+            cost=0.0,
+            metadata={**response.metadata, "from_cache": layer}
+        )
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss statistics."""
+        total_hits = self.hits["L1"] + self.hits["L2"]
+        return {
+            "exact_entries": len(self.exact),
+            "semantic_entries": len(self.semantic),
+            "hits": dict(self.hits),
+            "misses": self.misses,
+            "hit_rate": total_hits / max(1, total_hits + self.misses)
+        }
 
 class AIServiceManager:
     """Multi-AI service integration manager with intelligent routing."""
@@ -50,9 +223,34 @@ class AIServiceManager:
         self.services: Dict[str, AIServiceConfig] = {}
         self.session: Optional[aiohttp.ClientSession] = None
         
+        # Optional HTTP/2 client for non-streaming calls (requires httpx[http2])
+        self.http2_client = None
+        self.use_http2 = bool(self.config.get("http2", False))
+        if self.use_http2 and httpx is None:
+            logger.warning("HTTP/2 requested but httpx[http2] is not installed, using aiohttp")
+            self.use_http2 = False
+        
         # Service usage tracking
         self.usage_stats = {}
-        self.rate_limits = {}
+        self.usage_totals = {"requests": 0, "tokens": 0, "cost": 0.0, "cancelled": 0}
+        self.service_order_table: Dict[Tuple[bool, bool, bool], List[str]] = {}
+        self.rate_buckets: Dict[str, Dict[str, float]] = {}
+        self.rate_lock = threading.Lock()  # Guards check-and-take on the rate buckets
+        
+        # Per-service circuit breakers
+        self.circuit_breakers: Dict[str, Dict[str, Any]] = {}
+        self.circuit_breaker_threshold = self.config.get("circuit_breaker_threshold", 5)
+        self.circuit_breaker_timeout = self.config.get("circuit_breaker_timeout", 30.0)
+        
+        # In-flight generations, keyed like the response cache, shared by concurrent identical requests
+        self.inflight_requests: Dict[bytes, asyncio.Task] = {}
+        
+        # Cache of successful responses
+        self.response_cache = ResponseCache(
+            max_size=self.config.get("cache_max_size", 10000),
+            ttl=self.config.get("cache_ttl", 3600.0)
+        )
+        self.cache_semantic = bool(self.config.get("cache_semantic", False))
         
         # Initialize services from environment variables
         self._initialize_services()
@@ -76,7 +274,7 @@ class AIServiceManager:
                 cost_per_1k_tokens=0.002,
                 priority=2
             )
-            self.usage_stats["openai"] = {"requests": 0, "tokens": 0, "cost": 0.0}
+            self.usage_stats["openai"] = {"requests": 0, "tokens": 0, "cost": 0.0, "ewma_latency": 0.0, "cancelled": 0}
             logger.info("OpenAI service configured")
         
         # Anthropic Claude Configuration
@@ -94,7 +292,7 @@ class AIServiceManager:
                 cost_per_1k_tokens=0.00025,
                 priority=1  # Highest priority for emotional intelligence
             )
-            self.usage_stats["claude"] = {"requests": 0, "tokens": 0, "cost": 0.0}
+            self.usage_stats["claude"] = {"requests": 0, "tokens": 0, "cost": 0.0, "ewma_latency": 0.0, "cancelled": 0}
             logger.info("Claude service configured")
         
         # Groq Configuration
@@ -112,21 +310,82 @@ class AIServiceManager:
                 cost_per_1k_tokens=0.0,  # Free tier
                 priority=0  # Highest priority for speed
             )
-            self.usage_stats["groq"] = {"requests": 0, "tokens": 0, "cost": 0.0}
+            self.usage_stats["groq"] = {"requests": 0, "tokens": 0, "cost": 0.0, "ewma_latency": 0.0, "cancelled": 0}
             logger.info("Groq service configured")
         
         if not self.services:
             logger.warning("No AI services configured - check environment variables")
+        
+        self._build_service_order_table()
     
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession()
+        await self.startup()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
+        await self.aclose()
+    
+    async def startup(self):
+        """Open the shared HTTP session."""
+        self._get_session()
+    
+    async def aclose(self):
+        """Close the shared HTTP session."""
+        if self.session and not self.session.closed:
             await self.session.close()
+        self.session = None
+        if self.http2_client is not None:
+            await self.http2_client.aclose()
+        self.http2_client = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it with a pooled connector on first use."""
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=32,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=None),
+                headers={"User-Agent": "mythiq/1.0"}
+            )
+        return self.session
+    
+    def _get_http2_client(self):
+        """Get the shared HTTP/2 client, multiplexing concurrent requests per host."""
+        if self.http2_client is None:
+            self.http2_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                timeout=httpx.Timeout(30.0),
+                headers={"User-Agent": "mythiq/1.0"}
+            )
+        return self.http2_client
+    
+    async def _post_json(self, config: AIServiceConfig, payload: Dict[str, Any]) -> Tuple[int, bytes]:
+        """POST a JSON payload to a service endpoint and return the status and raw body."""
+        if self.use_http2:
+            response = await self._get_http2_client().post(
+                config.endpoint,
+                headers=config.headers,
+                content=_json_dumps(payload),
+                timeout=config.timeout
+            )
+            return response.status_code, response.content
+        
+        async with self._get_session().post(
+            config.endpoint,
+            headers=config.headers,
+            data=_json_dumps(payload),
+            timeout=aiohttp.ClientTimeout(total=config.timeout)
+        ) as response:
+            return response.status, await response.read()
     
     async def generate_response(self, prompt: str, context: Dict[str, Any] = None,
                               preferences: Dict[str, Any] = None) -> AIServiceResponse:
@@ -134,6 +393,43 @@ class AIServiceManager:
         context = context or {}
         preferences = preferences or {}
         
+        # Serve repeated prompts from the response cache
+        use_cache = preferences.get("use_cache", True)
+        if not use_cache:
+            return await self._generate_uncached(prompt, context, preferences)
+        
+        cache_key = self.response_cache.make_key(prompt, context, preferences)
+        # The normalized L2 layer is opt-in and only used for context-free prompts
+        semantic_key = None
+        if preferences.get("semantic_cache", self.cache_semantic) and not context.get("conversation_history"):
+            semantic_key = self.response_cache.make_semantic_key(prompt, context, preferences)
+        cached_response = self.response_cache.get(cache_key, semantic_key)
+        if cached_response:
+            return cached_response
+        
+        # Coalesce concurrent cache misses for the same key onto one generation
+        task = self.inflight_requests.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._generate_and_cache(cache_key, semantic_key, prompt, context, preferences)
+            )
+            self.inflight_requests[cache_key] = task
+            task.add_done_callback(lambda _: self.inflight_requests.pop(cache_key, None))
+        
+        # Shield the shared task so one cancelled caller does not cancel it for the others
+        return await asyncio.shield(task)
+    
+    async def _generate_and_cache(self, cache_key: bytes, semantic_key: Optional[Tuple], prompt: str,
+                                context: Dict[str, Any], preferences: Dict[str, Any]) -> AIServiceResponse:
+        """Generate a response and cache it if successful."""
+        response = await self._generate_uncached(prompt, context, preferences)
+        if response.success:
+            self.response_cache.put(cache_key, response, semantic_key)
+        return response
+    
+    async def _generate_uncached(self, prompt: str, context: Dict[str, Any],
+                               preferences: Dict[str, Any]) -> AIServiceResponse:
+        """Generate a response by routing through the available AI services."""
         # Determine service order based on preferences and availability
         service_order = self._get_service_order(preferences)
         
@@ -149,17 +445,19 @@ class AIServiceManager:
                 error_message="No AI services available"
             )
         
-        # Try services in order
-        for service_name in service_order:
-            try:
-                response = await self._call_service(service_name, prompt, context, preferences)
-                if response.success:
-                    self._update_usage_stats(service_name, response)
-                    return response
-                else:
-                    logger.warning(f"Service {service_name} failed: {response.error_message}")
-            except Exception as e:
-                logger.error(f"Error calling service {service_name}: {e}")
+        # Trim conversation history once for every service attempt
+        history_messages = self._build_history_messages(context)
+        
+        # Try services one at a time unless the caller opts into racing the top `hedge` of them
+        hedge = max(1, int(preferences.get("hedge", 1)))
+        service_groups = [service_order[:hedge]] + [[name] for name in service_order[hedge:]]
+        
+        for service_group in service_groups:
+            response = await self._call_first_success(
+                service_group, prompt, context, preferences, history_messages
+            )
+            if response:
+                return response
         
         # All services failed
         return AIServiceResponse(
@@ -173,161 +471,371 @@ class AIServiceManager:
             error_message="All AI services failed"
         )
     
+    async def _call_first_success(self, service_names: List[str], prompt: str,
+                                context: Dict[str, Any], preferences: Dict[str, Any],
+                                history_messages: List[Dict[str, str]] = None) -> Optional[AIServiceResponse]:
+        """Call services concurrently and return the first successful response, cancelling the rest.
+        
+        Every call that was launched is recorded in the usage stats, including
+        extra successes and calls cancelled mid-flight, which may still be billed.
+        """
+        tasks = {
+            asyncio.create_task(
+                self._call_service(service_name, prompt, context, preferences, history_messages)
+            ): service_name
+            for service_name in service_names
+        }
+        pending = set(tasks)
+        winner = None
+        
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    service_name = tasks[task]
+                    try:
+                        response = task.result()
+                    except Exception as e:
+                        logger.error(f"Error calling service {service_name}: {e}")
+                        continue
+                    
+                    if response.success:
+                        self._update_usage_stats(service_name, response)
+                        winner = winner or response
+                    else:
+                        logger.warning(f"Service {service_name} failed: {response.error_message}")
+        finally:
+            for task in pending:
+                task.cancel()
+            results = await asyncio.gather(*pending, return_exceptions=True)
+            for task, result in zip(pending, results):
+                if isinstance(result, asyncio.CancelledError):
+                    self._record_cancelled_call(tasks[task])
+                elif isinstance(result, AIServiceResponse) and result.success:
+                    # Finished before the cancellation landed
+                    self._update_usage_stats(tasks[task], result)
+        
+        return winner
+    
     def _get_service_order(self, preferences: Dict[str, Any]) -> List[str]:
         """Get ordered list of services to try based on preferences."""
-        available_services = list(self.services.keys())
-        
-        if not available_services:
+        if not self.services:
             return []
         
-        # Check preferences
-        prefer_speed = preferences.get("prefer_speed", False)
-        prefer_quality = preferences.get("prefer_quality", False)
-        prefer_free = preferences.get("prefer_free", True)
+        if preferences.get("routing") == "weighted":
+            ordered_services = [
+                service_name for service_name in self._get_weighted_service_order()
+                if self._is_service_available(service_name)
+            ]
+            logger.debug(f"Weighted service order: {ordered_services}")
+            return ordered_services
         
-        # Calculate service scores
-        service_scores = {}
-        for service_name in available_services:
-            if not self._is_service_available(service_name):
-                continue
-                
-            config = self.services[service_name]
-            score = 100 - config.priority  # Lower priority number = higher score
-            
-            # Apply preference modifiers
-            if prefer_speed and service_name == "groq":
-                score += 50  # Groq is fastest
-            
-            if prefer_quality and service_name == "claude":
-                score += 30  # Claude is best for emotional intelligence
-            
-            if prefer_free and config.cost_per_1k_tokens == 0.0:
-                score += 20  # Free services get bonus
-            
-            # Recent performance factor
-            stats = self.usage_stats.get(service_name, {})
-            if stats.get("requests", 0) > 0:
-                # Simple success rate boost (could be more sophisticated)
-                score += 10
-            
-            service_scores[service_name] = score
+        if not self.service_order_table:
+            self._build_service_order_table()
         
-        # Sort by score (highest first)
-        ordered_services = sorted(
-            service_scores.keys(),
-            key=lambda s: service_scores[s],
-            reverse=True
+        preference_key = (
+            bool(preferences.get("prefer_speed", False)),
+            bool(preferences.get("prefer_quality", False)),
+            bool(preferences.get("prefer_free", True))
         )
+        ordered_services = [
+            service_name for service_name in self.service_order_table[preference_key]
+            if self._is_service_available(service_name)
+        ]
         
         logger.debug(f"Service order: {ordered_services}")
         return ordered_services
     
+    def _get_weighted_service_order(self) -> List[str]:
+        """Order services to minimize the expected cost of the fallback chain.
+        
+        Each attempt costs its expected token spend plus a latency charge, and
+        only falls through to the next service on failure. The expected cost of
+        the whole chain is minimized by trying services in increasing order of
+        attempt_cost / success_rate, which is the cheapest path to success
+        through the fallback graph.
+        """
+        expected_tokens = self.config.get("routing_expected_tokens", 500)
+        latency_weight = self.config.get("routing_latency_weight", 0.001)
+        
+        weights = {}
+        for service_name, config in self.services.items():
+            stats = self.usage_stats.get(service_name, {})
+            failure_rate = self._get_circuit_breaker(service_name)["failure_rate"]
+            
+            attempt_cost = (
+                config.cost_per_1k_tokens * expected_tokens / 1000
+                + latency_weight * stats.get("ewma_latency", 0.0)
+            )
+            weights[service_name] = (attempt_cost / max(0.01, 1.0 - failure_rate), config.priority)
+        
+        return sorted(weights.keys(), key=lambda s: weights[s])
+    
+    def _build_service_order_table(self):
+        """Precompute service order for every preference combination."""
+        self.service_order_table = {}
+        
+        for preference_key in itertools.product((False, True), repeat=3):
+            prefer_speed, prefer_quality, prefer_free = preference_key
+            
+            # Calculate service scores
+            service_scores = {}
+            for service_name, config in self.services.items():
+                score = 100 - config.priority  # Lower priority number = higher score
+                
+                # Apply preference modifiers
+                if prefer_speed and service_name == "groq":
+                    score += 50  # Groq is fastest
+                
+                if prefer_quality and service_name == "claude":
+                    score += 30  # Claude is best for emotional intelligence
+                
+                if prefer_free and config.cost_per_1k_tokens == 0.0:
+                    score += 20  # Free services get bonus
+                
+                # Recent performance factor
+                stats = self.usage_stats.get(service_name, {})
+                if stats.get("requests", 0) > 0:
+                    # Proven services get a boost, reduced by their average latency
+                    score += 10 - self._latency_penalty(stats)
+                
+                service_scores[service_name] = score
+            
+            # Sort by score (highest first)
+            self.service_order_table[preference_key] = sorted(
+                service_scores.keys(),
+                key=lambda s: service_scores[s],
+                reverse=True
+            )
+    
     def _is_service_available(self, service_name: str) -> bool:
-        """Check if service is available (not rate limited)."""
+        """Check if service is available (circuit not open, not rate limited) without changing any state."""
         if service_name not in self.services:
             return False
         
-        # Check rate limiting (simplified)
-        current_time = datetime.now()
-        rate_limit_key = f"{service_name}_{current_time.strftime('%Y%m%d%H%M')}"
+        # Check circuit breaker; the open -> half_open transition happens in _begin_service_call
+        breaker = self.circuit_breakers.get(service_name)
+        if breaker is not None:
+            if breaker["state"] == "open" and time.monotonic() < breaker["open_until"]:
+                return False
+            if breaker["state"] == "half_open" and breaker["probing"]:
+                return False
         
-        if rate_limit_key not in self.rate_limits:
-            self.rate_limits[rate_limit_key] = 0
+        # Check rate limiting (the token itself is only taken when the call starts)
+        with self.rate_lock:
+            return self._refill_rate_bucket(service_name)["tokens"] >= 1.0
+    
+    def _get_circuit_breaker(self, service_name: str) -> Dict[str, Any]:
+        """Get or create the circuit breaker state for a service."""
+        breaker = self.circuit_breakers.get(service_name)
+        if breaker is None:
+            breaker = {"state": "closed", "failures": 0, "open_until": 0.0, "probing": False, "failure_rate": 0.0}
+            self.circuit_breakers[service_name] = breaker
+        return breaker
+    
+    def _record_circuit_result(self, service_name: str, success: bool):
+        """Update a service's circuit breaker after a call completes."""
+        breaker = self._get_circuit_breaker(service_name)
+        breaker["probing"] = False
+        breaker["failure_rate"] = 0.9 * breaker["failure_rate"] + (0.0 if success else 0.1)
         
-        config = self.services[service_name]
-        if self.rate_limits[rate_limit_key] >= config.rate_limit_per_minute:
-            return False
+        if success:
+            breaker["state"] = "closed"
+            breaker["failures"] = 0
+            return
+        
+        breaker["failures"] += 1
+        if breaker["state"] == "half_open" or breaker["failures"] >= self.circuit_breaker_threshold:
+            breaker["state"] = "open"
+            breaker["open_until"] = time.monotonic() + self.circuit_breaker_timeout
+            logger.warning(f"Circuit breaker opened for {service_name} for {self.circuit_breaker_timeout}s")
+    
+    def _refill_rate_bucket(self, service_name: str) -> Dict[str, float]:
+        """Refill a service's token bucket for the time elapsed since the last check."""
+        capacity = float(self.services[service_name].rate_limit_per_minute)
+        now = time.monotonic()
+        
+        bucket = self.rate_buckets.get(service_name)
+        if bucket is None:
+            bucket = {"tokens": capacity, "last_refill": now}
+            self.rate_buckets[service_name] = bucket
+        else:
+            elapsed = now - bucket["last_refill"]
+            bucket["tokens"] = min(capacity, bucket["tokens"] + elapsed * capacity / 60.0)
+            bucket["last_refill"] = now
         
-        return True
+        return bucket
     
     async def _call_service(self, service_name: str, prompt: str, 
-                          context: Dict[str, Any], preferences: Dict[str, Any]) -> AIServiceResponse:
+                          context: Dict[str, Any], preferences: Dict[str, Any],
+                          history_messages: List[Dict[str, str]] = None) -> AIServiceResponse:
         """Call specific AI service."""
         config = self.services[service_name]
-        start_time = datetime.now()
+        start_time = time.monotonic()
         
-        # Update rate limiting
-        current_time = datetime.now()
-        rate_limit_key = f"{service_name}_{current_time.strftime('%Y%m%d%H%M')}"
-        self.rate_limits[rate_limit_key] = self.rate_limits.get(rate_limit_key, 0) + 1
+        breaker = self._begin_service_call(service_name)
+        if breaker is None:
+            return AIServiceResponse(
+                success=False,
+                content="",
+                service_name=service_name,
+                model_used=config.model,
+                tokens_used=0,
+                response_time=0.0,
+                cost=0.0,
+                error_message="Service unavailable (circuit open or rate limited)"
+            )
         
         # Prepare request based on service type
-        if service_name == "claude":
-            response = await self._call_claude(config, prompt, context, preferences)
-        else:  # OpenAI-compatible (OpenAI, Groq)
-            response = await self._call_openai_compatible(config, prompt, context, preferences)
+        try:
+            if service_name == "claude":
+                response = await self._call_claude(config, prompt, context, preferences, history_messages)
+            else:  # OpenAI-compatible (OpenAI, Groq)
+                response = await self._call_openai_compatible(
+                    config, prompt, context, preferences, history_messages
+                )
+        except asyncio.CancelledError:
+            breaker["probing"] = False
+            raise
+        except Exception:
+            self._record_circuit_result(service_name, False)
+            raise
         
-        response.response_time = (datetime.now() - start_time).total_seconds()
+        self._record_circuit_result(service_name, response.success)
+        response.response_time = time.monotonic() - start_time
         return response
     
-    async def _call_claude(self, config: AIServiceConfig, prompt: str,
-                         context: Dict[str, Any], preferences: Dict[str, Any]) -> AIServiceResponse:
-        """Call Anthropic Claude API."""
-        headers = {
-            "Content-Type": "application/json",
-            "x-api-key": config.api_key,
-            "anthropic-version": "2023-06-01"
-        }
+    def _try_take_rate_token(self, service_name: str) -> bool:
+        """Take one rate limit token, checking and charging the bucket in a single step."""
+        with self.rate_lock:
+            bucket = self._refill_rate_bucket(service_name)
+            if bucket["tokens"] < 1.0:
+                return False
+            bucket["tokens"] -= 1.0
+            return True
+    
+    def _begin_service_call(self, service_name: str) -> Optional[Dict[str, Any]]:
+        """Admit a call through the circuit breaker and consume a rate limit token.
         
-        # Build messages for Claude
-        messages = []
+        Moves an open breaker whose cooldown has elapsed to half_open and marks
+        the call as its single probe. Returns None when the circuit is open, a
+        probe is already in flight, or the service has no token left.
+        """
+        breaker = self._get_circuit_breaker(service_name)
+        if breaker["state"] == "open":
+            if time.monotonic() < breaker["open_until"]:
+                return None
+            # Cooldown elapsed, allow a single probe request
+            breaker["state"] = "half_open"
+            breaker["probing"] = False
+        
+        if breaker["state"] == "half_open" and breaker["probing"]:
+            return None
         
-        # Add context if available
-        if context.get("conversation_history"):
-            for msg in context["conversation_history"][-5:]:  # Last 5 messages
-                role = "user" if msg.get("role") == "user" else "assistant"
-                messages.append({"role": role, "content": msg.get("content", "")})
+        if not self._try_take_rate_token(service_name):
+            return None
+        
+        if breaker["state"] == "half_open":
+            breaker["probing"] = True
+        
+        return breaker
+    
+    def _build_history_messages(self, context: Dict[str, Any]) -> List[Dict[str, str]]:
+        """Build provider-neutral messages from the last 5 conversation history entries.
+        
+        A missing role is left as None; each provider payload applies its own default.
+        """
+        return [
+            {"role": msg.get("role"), "content": msg.get("content", "")}
+            for msg in (context.get("conversation_history") or [])[-5:]
+        ]
+    
+    def _build_claude_payload(self, config: AIServiceConfig, prompt: str, context: Dict[str, Any],
+                            history_messages: List[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Build the request payload for the Claude messages API."""
+        if history_messages is None:
+            history_messages = self._build_history_messages(context)
+        
+        # Claude only accepts user and assistant turns; anything not from the user is an assistant turn
+        messages = [
+            {"role": "user" if msg["role"] == "user" else "assistant", "content": msg["content"]}
+            for msg in history_messages
+        ]
         
         # Add current prompt
         messages.append({"role": "user", "content": prompt})
         
-        payload = {
+        return {
             "model": config.model,
             "max_tokens": config.max_tokens,
             "temperature": config.temperature,
             "messages": messages
         }
+    
+    def _build_openai_payload(self, config: AIServiceConfig, prompt: str, context: Dict[str, Any],
+                            history_messages: List[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Build the request payload for an OpenAI-compatible chat completions API."""
+        if history_messages is None:
+            history_messages = self._build_history_messages(context)
+        
+        # Add system message for context
+        messages = [{"role": "system", "content": _system_message(context.get("ai_personality"))}]
+        
+        # Add conversation history (entries without a role count as user turns)
+        for msg in history_messages:
+            role = msg["role"] or "user"
+            if role in ("user", "assistant"):
+                messages.append({"role": role, "content": msg["content"]})
+        
+        # Add current prompt
+        messages.append({"role": "user", "content": prompt})
+        
+        return {
+            "model": config.model,
+            "messages": messages,
+            "max_tokens": config.max_tokens,
+            "temperature": config.temperature,
+            "stream": False
+        }
+    
+    async def _call_claude(self, config: AIServiceConfig, prompt: str,
+                         context: Dict[str, Any], preferences: Dict[str, Any],
+                         history_messages: List[Dict[str, str]] = None) -> AIServiceResponse:
+        """Call Anthropic Claude API."""
+        payload = self._build_claude_payload(config, prompt, context, history_messages)
         
         try:
-            if not self.session:
-                self.session = aiohttp.ClientSession()
+            status, body = await self._post_json(config, payload)
             
-            async with self.session.post(
-                f"{config.base_url}/messages",
-                headers=headers,
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=config.timeout)
-            ) as response:
+            if status == 200:
+                data = _json_loads(body)
+                content = data["content"][0]["text"]
+                tokens_used = data["usage"]["input_tokens"] + data["usage"]["output_tokens"]
+                cost = (tokens_used / 1000) * config.cost_per_1k_tokens
+                
+                return AIServiceResponse(
+                    success=True,
+                    content=content,
+                    service_name=config.name,
+                    model_used=config.model,
+                    tokens_used=tokens_used,
+                    response_time=0.0,  # Will be set by caller
+                    cost=cost,
+                    metadata={"usage": data["usage"]}
+                )
+            else:
+                error_text = body.decode("utf-8", errors="replace")
+                return AIServiceResponse(
+                    success=False,
+                    content="",
+                    service_name=config.name,
+                    model_used=config.model,
+                    tokens_used=0,
+                    response_time=0.0,
+                    cost=0.0,
+                    error_message=f"HTTP {status}: {error_text}"
+                )
                 
-                if response.status == 200:
-                    data = await response.json()
-                    content = data["content"][0]["text"]
-                    tokens_used = data["usage"]["input_tokens"] + data["usage"]["output_tokens"]
-                    cost = (tokens_used / 1000) * config.cost_per_1k_tokens
-                    
-                    return AIServiceResponse(
-                        success=True,
-                        content=content,
-                        service_name=config.name,
-                        model_used=config.model,
-                        tokens_used=tokens_used,
-                        response_time=0.0,  # Will be set by caller
-                        cost=cost,
-                        metadata={"usage": data["usage"]}
-                    )
-                else:
-                    error_text = await response.text()
-                    return AIServiceResponse(
-                        success=False,
-                        content="",
-                        service_name=config.name,
-                        model_used=config.model,
-                        tokens_used=0,
-                        response_time=0.0,
-                        cost=0.0,
-                        error_message=f"HTTP {response.status}: {error_text}"
-                    )
-                    
         except Exception as e:
             return AIServiceResponse(
                 success=False,
@@ -341,82 +849,43 @@ class AIServiceManager:
             )
     
     async def _call_openai_compatible(self, config: AIServiceConfig, prompt: str,
-                                    context: Dict[str, Any], preferences: Dict[str, Any]) -> AIServiceResponse:
+                                    context: Dict[str, Any], preferences: Dict[str, Any],
+                                    history_messages: List[Dict[str, str]] = None) -> AIServiceResponse:
         """Call OpenAI-compatible API (OpenAI, Groq)."""
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {config.api_key}"
-        }
-        
-        # Build messages
-        messages = []
-        
-        # Add system message for context
-        system_message = "You are Mythiq AI, an emotionally intelligent and creative AI assistant."
-        if context.get("ai_personality"):
-            personality = context["ai_personality"]
-            system_message += f" You are currently in {personality} mode."
-        
-        messages.append({"role": "system", "content": system_message})
-        
-        # Add conversation history
-        if context.get("conversation_history"):
-            for msg in context["conversation_history"][-5:]:  # Last 5 messages
-                role = msg.get("role", "user")
-                if role in ["user", "assistant"]:
-                    messages.append({"role": role, "content": msg.get("content", "")})
-        
-        # Add current prompt
-        messages.append({"role": "user", "content": prompt})
-        
-        payload = {
-            "model": config.model,
-            "messages": messages,
-            "max_tokens": config.max_tokens,
-            "temperature": config.temperature,
-            "stream": False
-        }
+        payload = self._build_openai_payload(config, prompt, context, history_messages)
         
         try:
-            if not self.session:
-                self.session = aiohttp.ClientSession()
+            status, body = await self._post_json(config, payload)
             
-            async with self.session.post(
-                f"{config.base_url}/chat/completions",
-                headers=headers,
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=config.timeout)
-            ) as response:
+            if status == 200:
+                data = _json_loads(body)
+                content = data["choices"][0]["message"]["content"]
+                tokens_used = data["usage"]["total_tokens"]
+                cost = (tokens_used / 1000) * config.cost_per_1k_tokens
+                
+                return AIServiceResponse(
+                    success=True,
+                    content=content,
+                    service_name=config.name,
+                    model_used=config.model,
+                    tokens_used=tokens_used,
+                    response_time=0.0,  # Will be set by caller
+                    cost=cost,
+                    metadata={"usage": data["usage"]}
+                )
+            else:
+                error_text = body.decode("utf-8", errors="replace")
+                return AIServiceResponse(
+                    success=False,
+                    content="",
+                    service_name=config.name,
+                    model_used=config.model,
+                    tokens_used=0,
+                    response_time=0.0,
+                    cost=0.0,
+                    error_message=f"HTTP {status}: {error_text}"
+                )
                 
-                if response.status == 200:
-                    data = await response.json()
-                    content = data["choices"][0]["message"]["content"]
-                    tokens_used = data["usage"]["total_tokens"]
-                    cost = (tokens_used / 1000) * config.cost_per_1k_tokens
-                    
-                    return AIServiceResponse(
-                        success=True,
-                        content=content,
-                        service_name=config.name,
-                        model_used=config.model,
-                        tokens_used=tokens_used,
-                        response_time=0.0,  # Will be set by caller
-                        cost=cost,
-                        metadata={"usage": data["usage"]}
-                    )
-                else:
-                    error_text = await response.text()
-                    return AIServiceResponse(
-                        success=False,
-                        content="",
-                        service_name=config.name,
-                        model_used=config.model,
-                        tokens_used=0,
-                        response_time=0.0,
-                        cost=0.0,
-                        error_message=f"HTTP {response.status}: {error_text}"
-                    )
-                    
         except Exception as e:
             return AIServiceResponse(
                 success=False,
@@ -429,18 +898,293 @@ class AIServiceManager:
                 error_message=str(e)
             )
     
+    async def generate_response_stream(self, prompt: str, context: Dict[str, Any] = None,
+                                     preferences: Dict[str, Any] = None) -> AsyncIterator[AIServiceResponse]:
+        """Stream a response from the best available AI service.
+        
+        Yields partial responses (metadata["partial"] is True) carrying each new
+        text delta, then one final response with the full content. The next
+        service is only tried if a service fails before producing any output.
+        """
+        context = context or {}
+        preferences = preferences or {}
+        
+        service_order = self._get_service_order(preferences)
+        
+        if not service_order:
+            yield AIServiceResponse(
+                success=False,
+                content="",
+                service_name="none",
+                model_used="none",
+                tokens_used=0,
+                response_time=0.0,
+                cost=0.0,
+                error_message="No AI services available",
+                metadata={"partial": False}
+            )
+            return
+        
+        # Trim conversation history once for every service attempt
+        history_messages = self._build_history_messages(context)
+        
+        for service_name in service_order:
+            config = self.services[service_name]
+            start_time = time.monotonic()
+            breaker = self._begin_service_call(service_name)
+            if breaker is None:
+                logger.warning(f"Service {service_name} unavailable (circuit open or rate limited), skipping")
+                continue
+            
+            if service_name == "claude":
+                stream = self._stream_claude(config, prompt, context, preferences, history_messages)
+            else:  # OpenAI-compatible (OpenAI, Groq)
+                stream = self._stream_openai_compatible(
+                    config, prompt, context, preferences, history_messages
+                )
+            
+            produced_output = False
+            final_response = None
+            try:
+                # Close the provider stream (and its HTTP response) even if the caller stops early
+                async with contextlib.aclosing(stream):
+                    async for response in stream:
+                        if response.metadata.get("partial"):
+                            produced_output = True
+                            yield response
+                        else:
+                            final_response = response
+            finally:
+                if final_response is None:
+                    breaker["probing"] = False
+            
+            if final_response is None:
+                final_response = AIServiceResponse(
+                    success=False,
+                    content="",
+                    service_name=service_name,
+                    model_used=config.model,
+                    tokens_used=0,
+                    response_time=0.0,
+                    cost=0.0,
+                    error_message="Stream ended without a final response",
+                    metadata={"partial": False}
+                )
+            
+            self._record_circuit_result(service_name, final_response.success)
+            final_response.response_time = time.monotonic() - start_time
+            
+            if final_response.success:
+                self._update_usage_stats(service_name, final_response)
+                yield final_response
+                return
+            
+            logger.warning(f"Service {service_name} failed: {final_response.error_message}")
+            if produced_output:
+                # Output already reached the caller, so we cannot switch services
+                yield final_response
+                return
+        
+        # All services failed
+        yield AIServiceResponse(
+            success=False,
+            content="",
+            service_name="failed",
+            model_used="none",
+            tokens_used=0,
+            response_time=0.0,
+            cost=0.0,
+            error_message="All AI services failed",
+            metadata={"partial": False}
+        )
+    
+    async def _stream_claude(self, config: AIServiceConfig, prompt: str,
+                           context: Dict[str, Any], preferences: Dict[str, Any],
+                           history_messages: List[Dict[str, str]] = None) -> AsyncIterator[AIServiceResponse]:
+        """Stream Anthropic Claude API response over server-sent events."""
+        payload = self._build_claude_payload(config, prompt, context, history_messages)
+        payload["stream"] = True
+        
+        content_parts = []
+        usage = {"input_tokens": 0, "output_tokens": 0}
+        
+        try:
+            async with self._get_session().post(
+                config.endpoint,
+                headers=config.headers,
+                data=_json_dumps(payload),
+                timeout=aiohttp.ClientTimeout(total=config.timeout)
+            ) as response:
+                
+                if response.status != 200:
+                    error_text = await response.text()
+                    yield self._failed_stream_response(config, f"HTTP {response.status}: {error_text}")
+                    return
+                
+                async for event in self._iter_sse_data(response):
+                    event_type = event.get("type")
+                    
+                    if event_type == "message_start":
+                        usage.update(event["message"].get("usage", {}))
+                    elif event_type == "content_block_delta":
+                        text = event["delta"].get("text")
+                        if text:
+                            content_parts.append(text)
+                            yield self._partial_stream_response(config, text)
+                    elif event_type == "message_delta":
+                        usage.update(event.get("usage", {}))
+                    elif event_type == "error":
+                        yield self._failed_stream_response(config, event["error"].get("message", "Stream error"))
+                        return
+                    
+        except Exception as e:
+            yield self._failed_stream_response(config, str(e))
+            return
+        
+        tokens_used = usage["input_tokens"] + usage["output_tokens"]
+        yield AIServiceResponse(
+            success=True,
+            content="".join(content_parts),
+            service_name=config.name,
+            model_used=config.model,
+            tokens_used=tokens_used,
+            response_time=0.0,  # Will be set by caller
+            cost=(tokens_used / 1000) * config.cost_per_1k_tokens,
+            metadata={"partial": False, "usage": usage}
+        )
+    
+    async def _stream_openai_compatible(self, config: AIServiceConfig, prompt: str,
+                                      context: Dict[str, Any], preferences: Dict[str, Any],
+                                      history_messages: List[Dict[str, str]] = None) -> AsyncIterator[AIServiceResponse]:
+        """Stream OpenAI-compatible API (OpenAI, Groq) response over server-sent events."""
+        payload = self._build_openai_payload(config, prompt, context, history_messages)
+        payload["stream"] = True
+        if config.name == "openai":
+            payload["stream_options"] = {"include_usage": True}
+        
+        content_parts = []
+        usage = {}
+        
+        try:
+            async with self._get_session().post(
+                config.endpoint,
+                headers=config.headers,
+                data=_json_dumps(payload),
+                timeout=aiohttp.ClientTimeout(total=config.timeout)
+            ) as response:
+                
+                if response.status != 200:
+                    error_text = await response.text()
+                    yield self._failed_stream_response(config, f"HTTP {response.status}: {error_text}")
+                    return
+                
+                async for chunk in self._iter_sse_data(response):
+                    # Groq reports usage under x_groq on the last chunk
+                    usage = chunk.get("usage") or (chunk.get("x_groq") or {}).get("usage") or usage
+                    
+                    for choice in chunk.get("choices", []):
+                        text = choice.get("delta", {}).get("content")
+                        if text:
+                            content_parts.append(text)
+                            yield self._partial_stream_response(config, text)
+                    
+        except Exception as e:
+            yield self._failed_stream_response(config, str(e))
+            return
+        
+        tokens_used = usage.get("total_tokens", 0)
+        yield AIServiceResponse(
+            success=True,
+            content="".join(content_parts),
+            service_name=config.name,
+            model_used=config.model,
+            tokens_used=tokens_used,
+            response_time=0.0,  # Will be set by caller
+            cost=(tokens_used / 1000) * config.cost_per_1k_tokens,
+            metadata={"partial": False, "usage": usage}
+        )
+    
+    async def _iter_sse_data(self, response) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the decoded JSON payload of each server-sent event data line."""
+        async for raw_line in response.content:
+            line = raw_line.decode("utf-8").strip()
+            if not line.startswith("data:"):
+                continue
+            
+            data = line[5:].strip()
+            if data == "[DONE]":
+                return
+            yield _json_loads(data)
+    
+    def _partial_stream_response(self, config: AIServiceConfig, text: str) -> AIServiceResponse:
+        """Build a partial streaming response carrying one text delta."""
+        return AIServiceResponse(
+            success=True,
+            content=text,
+            service_name=config.name,
+            model_used=config.model,
+            tokens_used=0,
+            response_time=0.0,
+            cost=0.0,
+            metadata={"partial": True}
+        )
+    
+    def _failed_stream_response(self, config: AIServiceConfig, error_message: str) -> AIServiceResponse:
+        """Build the final response for a failed stream."""
+        return AIServiceResponse(
+            success=False,
+            content="",
+            service_name=config.name,
+            model_used=config.model,
+            tokens_used=0,
+            response_time=0.0,
+            cost=0.0,
+            error_message=error_message,
+            metadata={"partial": False}
+        )
+    
+    def _latency_penalty(self, stats: Dict[str, Any]) -> int:
+        """Routing score penalty of one point per second of average latency, capped at 10."""
+        return min(10, int(stats.get("ewma_latency", 0.0)))
+    
     def _update_usage_stats(self, service_name: str, response: AIServiceResponse):
         """Update usage statistics for a service."""
         if service_name not in self.usage_stats:
-            self.usage_stats[service_name] = {"requests": 0, "tokens": 0, "cost": 0.0}
+            self.usage_stats[service_name] = {"requests": 0, "tokens": 0, "cost": 0.0, "ewma_latency": 0.0, "cancelled": 0}
         
         stats = self.usage_stats[service_name]
+        previous_penalty = self._latency_penalty(stats)
+        
         stats["requests"] += 1
         stats["tokens"] += response.tokens_used
         stats["cost"] += response.cost
         
+        self.usage_totals["requests"] += 1
+        self.usage_totals["tokens"] += response.tokens_used
+        self.usage_totals["cost"] += response.cost
+        
+        # Exponential moving average of response latency
+        if stats["requests"] == 1:
+            stats["ewma_latency"] = response.response_time
+        else:
+            stats["ewma_latency"] = 0.9 * stats["ewma_latency"] + 0.1 * response.response_time
+        
+        if stats["requests"] == 1 or self._latency_penalty(stats) != previous_penalty:
+            # Routing scores depend on first use and on whole seconds of latency
+            self.service_order_table.clear()
+        
         logger.debug(f"Updated stats for {service_name}: {stats}")
     
+    def _record_cancelled_call(self, service_name: str):
+        """Record a hedged call that was cancelled after it was sent."""
+        if service_name not in self.usage_stats:
+            self.usage_stats[service_name] = {"requests": 0, "tokens": 0, "cost": 0.0, "ewma_latency": 0.0, "cancelled": 0}
+        
+        self.usage_stats[service_name]["cancelled"] += 1
+        self.usage_totals["cancelled"] += 1
+        
+        logger.debug(f"Cancelled in-flight call to {service_name}")
+    
     async def generate_creative_content(self, prompt: str, content_type: str,
                                       context: Dict[str, Any] = None) -> AIServiceResponse:
         """Generate creative content with specialized prompting."""
@@ -531,30 +1275,34 @@ class AIServiceManager:
                 "priority": config.priority,
                 "cost_per_1k_tokens": config.cost_per_1k_tokens,
                 "available": self._is_service_available(service_name),
+                "circuit_breaker": self.circuit_breakers.get(service_name, {}).get("state", "closed"),
                 "usage_stats": stats
             }
         
         return {
             "services": status,
             "total_services": len(self.services),
-            "total_requests": sum(s.get("requests", 0) for s in self.usage_stats.values()),
-            "total_cost": sum(s.get("cost", 0.0) for s in self.usage_stats.values())
+            "total_requests": self.usage_totals["requests"],
+            "total_cost": self.usage_totals["cost"],
+            "response_cache": self.response_cache.get_stats()
         }
     
     def get_usage_summary(self) -> Dict[str, Any]:
         """Get usage summary across all services."""
-        total_requests = sum(s.get("requests", 0) for s in self.usage_stats.values())
-        total_tokens = sum(s.get("tokens", 0) for s in self.usage_stats.values())
-        total_cost = sum(s.get("cost", 0.0) for s in self.usage_stats.values())
+        total_requests = self.usage_totals["requests"]
+        total_tokens = self.usage_totals["tokens"]
+        total_cost = self.usage_totals["cost"]
         
         service_breakdown = {}
         for service_name, stats in self.usage_stats.items():
-            if stats.get("requests", 0) > 0:
+            if stats.get("requests", 0) > 0 or stats.get("cancelled", 0) > 0:
                 service_breakdown[service_name] = {
                     "requests": stats["requests"],
+                    "cancelled": stats["cancelled"],
                     "tokens": stats["tokens"],
                     "cost": stats["cost"],
-                    "avg_tokens_per_request": stats["tokens"] / stats["requests"],
+                    "avg_tokens_per_request": stats["tokens"] / max(1, stats["requests"]),
+                    "ewma_latency": stats["ewma_latency"],
                     "percentage_of_requests": (stats["requests"] / max(1, total_requests)) * 100
                 }
         
@@ -562,6 +1310,7 @@ class AIServiceManager:
             "total_requests": total_requests,
             "total_tokens": total_tokens,
             "total_cost": total_cost,
+            "total_cancelled": self.usage_totals["cancelled"],
             "average_tokens_per_request": total_tokens / max(1, total_requests),
             "service_breakdown": service_breakdown,
             "most_used_service": max(self.usage_stats.keys(), 
@@ -572,33 +1321,33 @@ class AIServiceManager:
     async def test_all_services(self) -> Dict[str, Any]:
         """Test all configured AI services."""
         test_prompt = "Hello! Please respond with a brief, friendly greeting."
-        results = {}
+        service_names = list(self.services.keys())
         
-        for service_name in self.services.keys():
-            try:
-                # Temporarily override service order to test specific service
-                original_services = dict(self.services)
-                self.services = {service_name: self.services[service_name]}
-                
-                response = await self.generate_response(test_prompt)
-                
-                results[service_name] = {
-                    "success": response.success,
-                    "response_time": response.response_time,
-                    "model_used": response.model_used,
-                    "tokens_used": response.tokens_used,
-                    "cost": response.cost,
-                    "error": response.error_message if not response.success else None
-                }
-                
-                # Restore original services
-                self.services = original_services
-                
-            except Exception as e:
-                results[service_name] = {
-                    "success": False,
-                    "error": str(e)
-                }
+        results = await asyncio.gather(
+            *(self._test_service(service_name, test_prompt) for service_name in service_names)
+        )
         
-        return results
+        return dict(zip(service_names, results))
+    
+    async def _test_service(self, service_name: str, prompt: str) -> Dict[str, Any]:
+        """Call a single service directly, bypassing routing and the response cache."""
+        try:
+            response = await self._call_service(service_name, prompt, {}, {})
+            if response.success:
+                self._update_usage_stats(service_name, response)
+            
+            return {
+                "success": response.success,
+                "response_time": response.response_time,
+                "model_used": response.model_used,
+                "tokens_used": response.tokens_used,
+                "cost": response.cost,
+                "error": response.error_message if not response.success else None
+            }
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
 
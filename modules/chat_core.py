@@ -3,18 +3,57 @@ Mythiq AI - Adaptive Chat Core
 Intelligent conversation engine with emotional awareness, memory integration, and personality adaptation
 """
 
+from __future__ import annotations
+
 import json
+import re
 import time
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+import types
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 import logging
+from collections import Counter, OrderedDict
 
-from .reasoning_engine import ReasoningEngine, ReasoningResult
+if TYPE_CHECKING:
+    # Only needed for annotations; the engine instance is injected into ChatCore
+    from .reasoning_engine import ReasoningEngine, ReasoningResult
 
 logger = logging.getLogger(__name__)
 
+# Personality styling markers, compiled once
+_ENTHUSIASTIC_MARKERS_RE = re.compile("[!🚀🌟✨🎉]")
+_CARING_MARKERS_RE = re.compile("[💝🤗💙]|❤️")
+_CREATIVE_MARKERS_RE = re.compile("[🎨✨🌈💡]")
+_FORMAL_EMOJI_RE = re.compile(" [🚀✨]")
+_FORMAL_PUNCTUATION = str.maketrans("!", ".")
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return types.MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+# Low-signal messages answered without running reasoning
+_ACK_MESSAGES = {
+    "hi": "greeting",
+    "hello": "greeting",
+    "hey": "greeting",
+    "thanks": "thanks",
+    "thank you": "thanks",
+    "bye": "farewell",
+    "ok": "acknowledgment"
+}
+_ACK_REPLIES = {
+    "greeting": "Hi again! What would you like to talk about?",
+    "thanks": "You're welcome! Is there anything else I can help with?",
+    "farewell": "Goodbye! It was lovely chatting with you.",
+    "acknowledgment": "Got it! What would you like to do next?"
+}
+
 class ConversationState(Enum):
     """Conversation state enumeration."""
     GREETING = "greeting"
@@ -44,7 +83,12 @@ class PersonalityMode(Enum):
     ENTHUSIASTIC = "enthusiastic"
     BALANCED = "balanced"
 
-@dataclass
+# Value -> member maps for per-turn coercion without Enum.__call__
+_STYLE_LOOKUP = {style.value: style for style in ResponseStyle}
+_PERSONALITY_LOOKUP = {personality.value: personality for personality in PersonalityMode}
+_PERSONALITY_INDEX = {personality: index for index, personality in enumerate(PersonalityMode)}
+
+@dataclass(slots=True)
 class ConversationContext:
     """Current conversation context."""
     conversation_id: str
@@ -58,8 +102,10 @@ class ConversationContext:
     preferred_style: ResponseStyle
     ai_personality: PersonalityMode
     last_reasoning: Optional[ReasoningResult] = None
+    current_topics_set: set = field(default_factory=set)  # Membership index for current_topics
+    user_goals_set: set = field(default_factory=set)  # Membership index for user_goals
 
-@dataclass
+@dataclass(slots=True)
 class ResponseGeneration:
     """Response generation configuration."""
     style: ResponseStyle
@@ -70,7 +116,7 @@ class ResponseGeneration:
     formality_level: float  # 0.0-1.0
     enthusiasm_level: float  # 0.0-1.0
 
-@dataclass
+@dataclass(slots=True)
 class ChatResponse:
     """Chat response with metadata."""
     response: str
@@ -82,7 +128,130 @@ class ChatResponse:
     confidence: float
     processing_time: float
     timestamp: str
-    suggestions: List[str] = None
+    suggestions: List[str] = field(default_factory=list)
+
+# Response phrase tables, built once at import
+_GREETINGS = {
+    PersonalityMode.ENTHUSIASTIC: ("Hello! I'm so excited to chat with you! 🌟",
+                                   "Hi there! Ready to create something amazing together? 🚀"),
+    PersonalityMode.CARING: ("Hello! I'm here to help and support you. 💝",
+                             "Hi! I'm glad you're here. How can I assist you today? 🤗"),
+    PersonalityMode.PROFESSIONAL: ("Good day! I'm Mythiq AI, ready to assist you.",
+                                   "Hello! How may I help you today?"),
+    PersonalityMode.CREATIVE: ("Hey! Let's spark some creativity together! ✨",
+                               "Hello, creative soul! What shall we imagine today? 🎨"),
+    PersonalityMode.TEACHER: ("Hello! I'm here to help you learn and grow! 📚",
+                              "Hi! What would you like to explore today? 🧠"),
+    PersonalityMode.BALANCED: ("Hello! I'm Mythiq AI, and I'm here to help! 😊",
+                               "Hi there! What can I do for you today? 🤖")
+}
+
+_CREATIVE_RESPONSES = (
+    "I love your creative vision! Your idea about '{message}' has so much potential! 🎨",
+    "That's an amazing creative concept! I can already imagine how wonderful '{message}' could be! ✨",
+    "Your creativity is inspiring! Let's bring your idea about '{message}' to life! 🚀",
+    "What a fantastic creative challenge! I'm excited to help you with '{message}'! 🌟"
+)
+_CREATIVE_MEDIUM_RESPONSES = _CREATIVE_RESPONSES + (
+    "Creating a {medium} sounds amazing! Your concept '{message}' will be incredible!",
+)
+
+_CREATIVE_ENCOURAGEMENTS = (
+    "Let's push the boundaries of imagination!",
+    "The possibilities are endless!",
+    "Your creativity knows no limits!",
+    "Let's make something truly unique!"
+)
+
+_ACKNOWLEDGMENTS = {
+    "joy": "I can feel your happiness and excitement! 😊",
+    "sadness": "I sense you might be feeling down, and that's okay. 💙",
+    "anger": "I can tell you're feeling frustrated, and I understand. 🤗",
+    "fear": "I notice some worry in your message, and I'm here for you. 💝",
+    "surprise": "You seem surprised! That's quite a reaction! 😮",
+    "love": "I can feel the warmth and care in your words! ❤️",
+    "anticipation": "I can sense your excitement about what's coming! 🌟"
+}
+
+_ENCOURAGEMENTS = (
+    "You've got this! 💪",
+    "I believe in your abilities! 🌟",
+    "Let's make something amazing together! 🚀",
+    "Your potential is limitless! ✨",
+    "I'm excited to see what we create! 🎨",
+    "Together, we can achieve anything! 🤝"
+)
+
+# Read-only response templates, personality traits, and conversation patterns
+_RESPONSE_TEMPLATES = _freeze({
+    "empathetic_caring": {
+        "greeting": "Hello, I'm here for you 💝",
+        "main": "I understand and care about your feelings",
+        "closing": "You're not alone in this"
+    },
+    "enthusiastic_creative": {
+        "greeting": "Hey there, creative soul! ✨",
+        "main": "Let's bring your amazing ideas to life!",
+        "closing": "The possibilities are endless! 🚀"
+    },
+    "informative_teacher": {
+        "greeting": "Hello! Ready to learn something new? 📚",
+        "main": "Let me explain this clearly and thoroughly",
+        "closing": "Knowledge is power! 🧠"
+    },
+    "default": {
+        "greeting": "Hello! 😊",
+        "main": "I'm here to help you",
+        "closing": "Let's make something great together! 🤖"
+    }
+})
+
+_PERSONALITY_TRAITS = _freeze({
+    PersonalityMode.ENTHUSIASTIC: {
+        "energy_level": "high",
+        "emoji_usage": "frequent",
+        "exclamation_usage": "high",
+        "encouragement_frequency": "high"
+    },
+    PersonalityMode.CARING: {
+        "empathy_expressions": "frequent",
+        "supportive_language": "high",
+        "emotional_validation": "high",
+        "gentle_tone": "high"
+    },
+    PersonalityMode.PROFESSIONAL: {
+        "formality_level": "high",
+        "technical_accuracy": "high",
+        "structured_responses": "high",
+        "emoji_usage": "minimal"
+    },
+    PersonalityMode.CREATIVE: {
+        "imaginative_language": "high",
+        "metaphor_usage": "frequent",
+        "artistic_references": "high",
+        "inspiration_focus": "high"
+    },
+    PersonalityMode.TEACHER: {
+        "explanation_detail": "high",
+        "educational_structure": "high",
+        "patience_level": "high",
+        "knowledge_sharing": "high"
+    },
+    PersonalityMode.BALANCED: {
+        "adaptability": "high",
+        "moderate_traits": "all",
+        "context_sensitivity": "high",
+        "versatility": "high"
+    }
+})
+
+_CONVERSATION_PATTERNS = _freeze({
+    "greeting_patterns": frozenset({"hello", "hi", "hey", "greetings"}),
+    "farewell_patterns": frozenset({"bye", "goodbye", "see you", "farewell"}),
+    "question_patterns": frozenset({"what", "how", "why", "when", "where", "who"}),
+    "creative_patterns": frozenset({"create", "make", "generate", "build", "design"}),
+    "emotional_patterns": frozenset({"feel", "emotion", "mood", "heart", "soul"})
+})
 
 class ChatCore:
     """Adaptive conversation engine with emotional intelligence."""
@@ -93,17 +262,42 @@ class ChatCore:
         self.memory_manager = memory_manager
         self.config = config or {}
         
-        # Active conversations
-        self.conversations: Dict[str, ConversationContext] = {}
+        # Active conversations, least recently used first
+        self.conversations: OrderedDict = OrderedDict()
+        self.max_active_conversations = self.config.get("max_active_conversations", 10000)
+        
+        # Running aggregates over active conversations for get_conversation_stats
+        self.conversation_totals = {"messages": 0, "active": 0, "engagement": 0.0}
+        self.state_counts: Counter = Counter()
+        self.personality_counts: List[int] = [0] * len(PersonalityMode)  # Indexed by _PERSONALITY_INDEX
+        
+        # Short-lived caches of per-user memory lookups (user_id -> (cached_at, value))
+        self.user_profile_cache: OrderedDict = OrderedDict()
+        self.emotional_pattern_cache: OrderedDict = OrderedDict()
+        self.user_cache_ttl = self.config.get("user_cache_ttl", 60.0)
+        self.user_cache_size = self.config.get("user_cache_size", 1024)
+        
+        # Answer greetings and acknowledgments without full reasoning
+        self.enable_fast_ack = self.config.get("enable_fast_ack", True)
         
         # Response templates by style and personality
-        self.response_templates = self._initialize_response_templates()
+        self.response_templates = _RESPONSE_TEMPLATES
+        self.template_index = self._build_template_index()
         
         # Personality characteristics
-        self.personality_traits = self._initialize_personality_traits()
+        self.personality_traits = _PERSONALITY_TRAITS
         
         # Conversation flow patterns
-        self.conversation_patterns = self._initialize_conversation_patterns()
+        self.conversation_patterns = _CONVERSATION_PATTERNS
+        
+        # Main response generators by primary intent
+        self.intent_handlers = {
+            "creative_request": self._generate_creative_response,
+            "information_request": self._generate_informational_response,
+            "emotional_support": self._generate_supportive_response,
+            "problem_solving": self._generate_problem_solving_response,
+            "casual_conversation": self._generate_casual_response
+        }
         
         logger.info("ChatCore initialized")
     
@@ -111,15 +305,22 @@ class ChatCore:
                        user_preferences: Dict[str, Any] = None) -> ChatResponse:
         """Process incoming message and generate intelligent response."""
         start_time = time.time()
+        timestamp = datetime.fromtimestamp(start_time).isoformat()
         
         # Get or create conversation context
         if conversation_id is None:
-            conversation_id = f"{user_id}_{int(time.time())}"
+            conversation_id = f"{user_id}_{int(start_time)}"
         
         context = self._get_or_create_conversation_context(
             conversation_id, user_id, user_preferences
         )
         
+        # Short-circuit trivial greetings and acknowledgments
+        if self.enable_fast_ack and len(message) < 16:
+            ack_kind = _ACK_MESSAGES.get(message.lower().strip(" .!?"))
+            if ack_kind:
+                return self._fast_ack_response(message, ack_kind, context, start_time, timestamp)
+        
         # Get conversation history for reasoning context
         reasoning_context = self._build_reasoning_context(context)
         
@@ -142,7 +343,7 @@ class ChatCore:
         
         # Store conversation in memory
         if self.memory_manager:
-            self._store_conversation_memory(context, message, response_text, reasoning_result)
+            self._store_conversation_memory(context, message, response_text, reasoning_result, timestamp)
         
         processing_time = time.time() - start_time
         
@@ -161,19 +362,75 @@ class ChatCore:
             reasoning_summary=self.reasoning_engine.get_reasoning_summary(reasoning_result),
             confidence=reasoning_result.confidence_score,
             processing_time=processing_time,
-            timestamp=datetime.now().isoformat(),
+            timestamp=timestamp,
             suggestions=suggestions
         )
         
-        logger.debug(f"Processed message for {user_id} in {processing_time:.3f}s")
+        logger.debug("Processed message for %s in %.3fs", user_id, processing_time)
         return response
     
+    def _fast_ack_response(self, message: str, ack_kind: str, context: ConversationContext,
+                           start_time: float, timestamp: str) -> ChatResponse:
+        """Answer a low-signal message without reasoning or suggestions."""
+        personality = context.ai_personality
+        response_config = ResponseGeneration(
+            style=context.preferred_style,
+            personality=personality,
+            tone="neutral",
+            empathy_level=0.5,
+            creativity_level=0.5,
+            formality_level=0.8 if personality == PersonalityMode.PROFESSIONAL else 0.3,
+            enthusiasm_level=0.5
+        )
+        
+        response_text = None
+        if ack_kind == "greeting":
+            response_text = self._generate_greeting(context, response_config)
+        response_text = self._apply_personality_styling(
+            [response_text or _ACK_REPLIES[ack_kind]], response_config, self.personality_traits[personality]
+        )
+        
+        # Store the turn so stored history stays in step with message_count
+        if self.memory_manager:
+            self.memory_manager.add_messages_to_conversation(context.conversation_id, [
+                {"role": "user", "content": message, "timestamp": timestamp},
+                {
+                    "role": "assistant",
+                    "content": response_text,
+                    "timestamp": timestamp,
+                    "response_style": response_config.style.value,
+                    "ai_personality": personality.value,
+                    "confidence": 1.0
+                }
+            ])
+        
+        return ChatResponse(
+            response=response_text,
+            conversation_id=context.conversation_id,
+            response_style=response_config.style.value,
+            ai_personality=personality.value,
+            emotional_awareness={
+                "detected_emotion": "neutral",
+                "emotion_intensity": 0.0,
+                "empathy_level": response_config.empathy_level,
+                "emotional_context": "neutral"
+            },
+            reasoning_summary={"fast_path": True, "intent": ack_kind},
+            confidence=1.0,
+            processing_time=time.time() - start_time,
+            timestamp=timestamp
+        )
+    
     def _get_or_create_conversation_context(self, conversation_id: str, user_id: str,
                                           user_preferences: Dict[str, Any] = None) -> ConversationContext:
         """Get existing or create new conversation context."""
-        if conversation_id in self.conversations:
-            context = self.conversations[conversation_id]
+        context = self.conversations.get(conversation_id)
+        if context is not None:
+            self.conversations.move_to_end(conversation_id)
             context.message_count += 1
+            self.conversation_totals["messages"] += 1
+            if context.message_count == 2:
+                self.conversation_totals["active"] += 1
             return context
         
         # Create new conversation context
@@ -182,7 +439,9 @@ class ChatCore:
         # Get user profile from memory if available
         user_profile = None
         if self.memory_manager:
-            user_profile = self.memory_manager.get_user_profile(user_id)
+            user_profile = self._get_cached_user_data(
+                self.user_profile_cache, user_id, self.memory_manager.get_user_profile
+            )
         
         # Determine initial preferences
         preferred_style = ResponseStyle(user_preferences.get(
@@ -204,14 +463,35 @@ class ChatCore:
             last_reasoning=None
         )
         
+        # Create conversation in memory manager, or resume one evicted earlier
+        if self.memory_manager:
+            stored_context = self.memory_manager.get_conversation_context(conversation_id, max_messages=1)
+            if "message_count" in stored_context:
+                context.message_count += stored_context["message_count"] // 2
+                context.current_topics = stored_context["topics"][-5:]
+                context.current_topics_set = set(context.current_topics)
+            else:
+                self.memory_manager.create_conversation(user_id, conversation_id)
+        
         self.conversations[conversation_id] = context
+        self._tally_conversation(context, 1)
         
-        # Create conversation in memory manager
-        if self.memory_manager:
-            self.memory_manager.create_conversation(user_id, conversation_id)
+        # Evict the least recently used conversation; its turns are already in memory
+        if len(self.conversations) > self.max_active_conversations:
+            _, evicted_context = self.conversations.popitem(last=False)
+            self._tally_conversation(evicted_context, -1)
         
         return context
     
+    def _tally_conversation(self, context: ConversationContext, sign: int):
+        """Add (sign=1) or remove (sign=-1) a conversation's share of the running stats."""
+        self.conversation_totals["messages"] += sign * context.message_count
+        self.conversation_totals["engagement"] += sign * context.engagement_level
+        if context.message_count > 1:
+            self.conversation_totals["active"] += sign
+        self.state_counts[context.state] += sign
+        self.personality_counts[_PERSONALITY_INDEX[context.ai_personality]] += sign
+    
     def _build_reasoning_context(self, context: ConversationContext) -> Dict[str, Any]:
         """Build context for reasoning engine."""
         reasoning_context = {
@@ -233,11 +513,30 @@ class ChatCore:
             reasoning_context.update(memory_context)
             
             # Add user emotional patterns
-            emotional_patterns = self.memory_manager.get_user_emotional_pattern(context.user_id)
+            emotional_patterns = self._get_cached_user_data(
+                self.emotional_pattern_cache, context.user_id, self.memory_manager.get_user_emotional_pattern
+            )
             reasoning_context["user_emotional_baseline"] = emotional_patterns
         
         return reasoning_context
     
+    def _get_cached_user_data(self, cache: OrderedDict, user_id: str, loader) -> Any:
+        """Get per-user memory data through a bounded TTL LRU cache."""
+        now = time.monotonic()
+        entry = cache.get(user_id)
+        if entry is not None and now - entry[0] < self.user_cache_ttl:
+            cache.move_to_end(user_id)
+            return entry[1]
+        
+        value = loader(user_id)
+        cache[user_id] = (now, value)
+        cache.move_to_end(user_id)
+        
+        while len(cache) > self.user_cache_size:
+            cache.popitem(last=False)
+        
+        return value
+    
     def _update_conversation_context(self, context: ConversationContext, 
                                    reasoning_result: ReasoningResult, message: str):
         """Update conversation context based on reasoning analysis."""
@@ -245,31 +544,47 @@ class ChatCore:
         context.emotional_state = reasoning_result.emotion_analysis.emotions
         
         # Update engagement level
-        context.engagement_level = reasoning_result.context_analysis.engagement_level
+        engagement_level = reasoning_result.context_analysis.engagement_level
+        self.conversation_totals["engagement"] += engagement_level - context.engagement_level
+        context.engagement_level = engagement_level
         
         # Update topics
         new_topics = reasoning_result.context_analysis.topics
         for topic in new_topics:
-            if topic not in context.current_topics:
+            if topic not in context.current_topics_set:
+                context.current_topics_set.add(topic)
                 context.current_topics.append(topic)
         
         # Keep only recent topics (max 5)
-        context.current_topics = context.current_topics[-5:]
+        if len(context.current_topics) > 5:
+            context.current_topics = context.current_topics[-5:]
+            context.current_topics_set = set(context.current_topics)
         
         # Update user goals
         new_goals = reasoning_result.context_analysis.user_goals
         for goal in new_goals:
-            if goal not in context.user_goals:
+            if goal not in context.user_goals_set:
+                context.user_goals_set.add(goal)
                 context.user_goals.append(goal)
         
         # Keep only recent goals (max 3)
-        context.user_goals = context.user_goals[-3:]
+        if len(context.user_goals) > 3:
+            context.user_goals = context.user_goals[-3:]
+            context.user_goals_set = set(context.user_goals)
         
         # Update conversation state
-        context.state = self._determine_conversation_state(reasoning_result)
+        state = self._determine_conversation_state(reasoning_result)
+        if state != context.state:
+            self.state_counts[context.state] -= 1
+            self.state_counts[state] += 1
+            context.state = state
         
         # Update AI personality based on context
-        context.ai_personality = PersonalityMode(reasoning_result.recommended_personality)
+        personality = _PERSONALITY_LOOKUP.get(reasoning_result.recommended_personality, PersonalityMode.BALANCED)
+        if personality != context.ai_personality:
+            self.personality_counts[_PERSONALITY_INDEX[context.ai_personality]] -= 1
+            self.personality_counts[_PERSONALITY_INDEX[personality]] += 1
+            context.ai_personality = personality
         
         # Store reasoning result
         context.last_reasoning = reasoning_result
@@ -293,8 +608,8 @@ class ChatCore:
                                 reasoning_result: ReasoningResult) -> ResponseGeneration:
         """Generate response configuration based on context and reasoning."""
         # Base configuration from reasoning
-        style = ResponseStyle(reasoning_result.recommended_response_style)
-        personality = PersonalityMode(reasoning_result.recommended_personality)
+        style = _STYLE_LOOKUP.get(reasoning_result.recommended_response_style, ResponseStyle.BALANCED)
+        personality = _PERSONALITY_LOOKUP.get(reasoning_result.recommended_personality, PersonalityMode.BALANCED)
         
         # Adjust based on user preferences
         if context.preferred_style != ResponseStyle.BALANCED:
@@ -365,16 +680,22 @@ class ChatCore:
         if encouragement and response_config.enthusiasm_level > 0.6:
             response_parts.append(encouragement)
         
-        # Join parts and apply personality styling
-        response = " ".join(response_parts)
-        response = self._apply_personality_styling(response, response_config, personality_elements)
-        
-        return response
+        # Apply personality styling and join the parts once
+        return self._apply_personality_styling(response_parts, response_config, personality_elements)
     
     def _get_response_template(self, style: ResponseStyle, personality: PersonalityMode) -> Dict[str, str]:
         """Get response template for style and personality combination."""
-        return self.response_templates.get(f"{style.value}_{personality.value}", 
-                                         self.response_templates["default"])
+        return self.template_index.get((style, personality), self.response_templates["default"])
+    
+    def _build_template_index(self) -> Dict[Tuple[ResponseStyle, PersonalityMode], Dict[str, str]]:
+        """Index response templates by (style, personality) so lookups skip key formatting."""
+        template_index = {}
+        for style in ResponseStyle:
+            for personality in PersonalityMode:
+                template = self.response_templates.get(f"{style.value}_{personality.value}")
+                if template is not None:
+                    template_index[(style, personality)] = template
+        return template_index
     
     def _generate_greeting(self, context: ConversationContext, 
                          response_config: ResponseGeneration) -> Optional[str]:
@@ -382,72 +703,39 @@ class ChatCore:
         if context.message_count > 2:
             return None
         
-        greetings = {
-            PersonalityMode.ENTHUSIASTIC: ["Hello! I'm so excited to chat with you! 🌟", 
-                                         "Hi there! Ready to create something amazing together? 🚀"],
-            PersonalityMode.CARING: ["Hello! I'm here to help and support you. 💝",
-                                   "Hi! I'm glad you're here. How can I assist you today? 🤗"],
-            PersonalityMode.PROFESSIONAL: ["Good day! I'm Mythiq AI, ready to assist you.",
-                                         "Hello! How may I help you today?"],
-            PersonalityMode.CREATIVE: ["Hey! Let's spark some creativity together! ✨",
-                                     "Hello, creative soul! What shall we imagine today? 🎨"],
-            PersonalityMode.TEACHER: ["Hello! I'm here to help you learn and grow! 📚",
-                                    "Hi! What would you like to explore today? 🧠"],
-            PersonalityMode.BALANCED: ["Hello! I'm Mythiq AI, and I'm here to help! 😊",
-                                     "Hi there! What can I do for you today? 🤖"]
-        }
-        
-        personality_greetings = greetings.get(response_config.personality, greetings[PersonalityMode.BALANCED])
+        personality_greetings = _GREETINGS.get(response_config.personality, _GREETINGS[PersonalityMode.BALANCED])
         return personality_greetings[context.message_count % len(personality_greetings)]
     
     def _generate_main_response(self, message: str, reasoning_result: ReasoningResult,
                               response_config: ResponseGeneration) -> str:
         """Generate main response content."""
         intent = reasoning_result.intent_analysis.primary_intent
-        emotion = reasoning_result.emotion_analysis.dominant_emotion
         
         # Intent-based response generation
-        if intent == "creative_request":
-            return self._generate_creative_response(message, reasoning_result, response_config)
-        elif intent == "information_request":
-            return self._generate_informational_response(message, reasoning_result, response_config)
-        elif intent == "emotional_support":
-            return self._generate_supportive_response(message, reasoning_result, response_config)
-        elif intent == "problem_solving":
-            return self._generate_problem_solving_response(message, reasoning_result, response_config)
-        elif intent == "casual_conversation":
-            return self._generate_casual_response(message, reasoning_result, response_config)
-        else:
-            return self._generate_default_response(message, reasoning_result, response_config)
+        handler = self.intent_handlers.get(intent, self._generate_default_response)
+        return handler(message, reasoning_result, response_config)
     
     def _generate_creative_response(self, message: str, reasoning_result: ReasoningResult,
                                   response_config: ResponseGeneration) -> str:
         """Generate response for creative requests."""
         entities = reasoning_result.intent_analysis.entities
         
-        creative_responses = [
-            f"I love your creative vision! Your idea about '{message}' has so much potential! 🎨",
-            f"That's an amazing creative concept! I can already imagine how wonderful '{message}' could be! ✨",
-            f"Your creativity is inspiring! Let's bring your idea about '{message}' to life! 🚀",
-            f"What a fantastic creative challenge! I'm excited to help you with '{message}'! 🌟"
-        ]
+        creative_responses = _CREATIVE_RESPONSES
+        medium = None
         
         # Add specific creative medium mentions if detected
         if entities.get("creative_mediums"):
             medium = entities["creative_mediums"][0]
-            creative_responses.append(f"Creating a {medium} sounds amazing! Your concept '{message}' will be incredible!")
+            creative_responses = _CREATIVE_MEDIUM_RESPONSES
         
-        base_response = creative_responses[len(message) % len(creative_responses)]
+        # Interpolate only the chosen template
+        base_response = creative_responses[len(message) % len(creative_responses)].format(
+            message=message, medium=medium
+        )
         
         # Add creative encouragement
         if response_config.creativity_level > 0.7:
-            encouragements = [
-                "Let's push the boundaries of imagination!",
-                "The possibilities are endless!",
-                "Your creativity knows no limits!",
-                "Let's make something truly unique!"
-            ]
-            encouragement = encouragements[len(message) % len(encouragements)]
+            encouragement = _CREATIVE_ENCOURAGEMENTS[len(message) % len(_CREATIVE_ENCOURAGEMENTS)]
             base_response += f" {encouragement}"
         
         return base_response
@@ -520,17 +808,7 @@ class ChatCore:
         if intensity < 0.5:
             return None
         
-        acknowledgments = {
-            "joy": "I can feel your happiness and excitement! 😊",
-            "sadness": "I sense you might be feeling down, and that's okay. 💙",
-            "anger": "I can tell you're feeling frustrated, and I understand. 🤗",
-            "fear": "I notice some worry in your message, and I'm here for you. 💝",
-            "surprise": "You seem surprised! That's quite a reaction! 😮",
-            "love": "I can feel the warmth and care in your words! ❤️",
-            "anticipation": "I can sense your excitement about what's coming! 🌟"
-        }
-        
-        return acknowledgments.get(emotion)
+        return _ACKNOWLEDGMENTS.get(emotion)
     
     def _generate_encouragement(self, context: ConversationContext, 
                               reasoning_result: ReasoningResult,
@@ -539,38 +817,29 @@ class ChatCore:
         if response_config.enthusiasm_level < 0.6:
             return None
         
-        encouragements = [
-            "You've got this! 💪",
-            "I believe in your abilities! 🌟",
-            "Let's make something amazing together! 🚀",
-            "Your potential is limitless! ✨",
-            "I'm excited to see what we create! 🎨",
-            "Together, we can achieve anything! 🤝"
-        ]
-        
-        return encouragements[context.message_count % len(encouragements)]
+        return _ENCOURAGEMENTS[context.message_count % len(_ENCOURAGEMENTS)]
     
-    def _apply_personality_styling(self, response: str, response_config: ResponseGeneration,
+    def _apply_personality_styling(self, response_parts: List[str], response_config: ResponseGeneration,
                                  personality_elements: Dict[str, Any]) -> str:
-        """Apply personality-specific styling to response."""
-        # Add personality-specific phrases or modifications
+        """Apply personality-specific styling to response parts and join them."""
+        # Add personality-specific phrases or modifications as a final part
         if response_config.personality == PersonalityMode.ENTHUSIASTIC:
-            if not any(emoji in response for emoji in ["!", "🚀", "🌟", "✨", "🎉"]):
-                response += " 🚀"
+            if not any(_ENTHUSIASTIC_MARKERS_RE.search(part) for part in response_parts):
+                response_parts.append("🚀")
         
         elif response_config.personality == PersonalityMode.CARING:
-            if not any(emoji in response for emoji in ["💝", "🤗", "💙", "❤️"]):
-                response += " 💝"
+            if not any(_CARING_MARKERS_RE.search(part) for part in response_parts):
+                response_parts.append("💝")
         
         elif response_config.personality == PersonalityMode.CREATIVE:
-            if not any(emoji in response for emoji in ["🎨", "✨", "🌈", "💡"]):
-                response += " ✨"
+            if not any(_CREATIVE_MARKERS_RE.search(part) for part in response_parts):
+                response_parts.append("✨")
+        
+        response = " ".join(response_parts)
         
         # Adjust formality
         if response_config.formality_level > 0.7:
-            response = response.replace("!", ".")
-            response = response.replace(" 🚀", "")
-            response = response.replace(" ✨", "")
+            response = _FORMAL_EMOJI_RE.sub("", response.translate(_FORMAL_PUNCTUATION))
         
         return response
     
@@ -604,7 +873,7 @@ class ChatCore:
         return suggestions[:3]  # Limit to 3 suggestions
     
     def _store_conversation_memory(self, context: ConversationContext, message: str,
-                                 response: str, reasoning_result: ReasoningResult):
+                                 response: str, reasoning_result: ReasoningResult, timestamp: str):
         """Store conversation in memory manager."""
         if not self.memory_manager:
             return
@@ -612,126 +881,37 @@ class ChatCore:
         message_data = {
             "role": "user",
             "content": message,
-            "timestamp": datetime.now().isoformat(),
-            "detected_emotions": reasoning_result.emotion_analysis.emotions,
+            "timestamp": timestamp,
+            "detected_emotions": dict(reasoning_result.emotion_analysis.emotions),
             "detected_intent": reasoning_result.intent_analysis.primary_intent,
-            "detected_topics": reasoning_result.context_analysis.topics
+            "detected_topics": list(reasoning_result.context_analysis.topics)
         }
         
         response_data = {
             "role": "assistant",
             "content": response,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "response_style": context.preferred_style.value,
             "ai_personality": context.ai_personality.value,
             "confidence": reasoning_result.confidence_score
         }
         
-        # Add messages to conversation
-        self.memory_manager.add_message_to_conversation(context.conversation_id, message_data)
-        self.memory_manager.add_message_to_conversation(context.conversation_id, response_data)
-    
-    def _initialize_response_templates(self) -> Dict[str, Dict[str, str]]:
-        """Initialize response templates."""
-        return {
-            "empathetic_caring": {
-                "greeting": "Hello, I'm here for you 💝",
-                "main": "I understand and care about your feelings",
-                "closing": "You're not alone in this"
-            },
-            "enthusiastic_creative": {
-                "greeting": "Hey there, creative soul! ✨",
-                "main": "Let's bring your amazing ideas to life!",
-                "closing": "The possibilities are endless! 🚀"
-            },
-            "informative_teacher": {
-                "greeting": "Hello! Ready to learn something new? 📚",
-                "main": "Let me explain this clearly and thoroughly",
-                "closing": "Knowledge is power! 🧠"
-            },
-            "default": {
-                "greeting": "Hello! 😊",
-                "main": "I'm here to help you",
-                "closing": "Let's make something great together! 🤖"
-            }
-        }
-    
-    def _initialize_personality_traits(self) -> Dict[PersonalityMode, Dict[str, Any]]:
-        """Initialize personality traits."""
-        return {
-            PersonalityMode.ENTHUSIASTIC: {
-                "energy_level": "high",
-                "emoji_usage": "frequent",
-                "exclamation_usage": "high",
-                "encouragement_frequency": "high"
-            },
-            PersonalityMode.CARING: {
-                "empathy_expressions": "frequent",
-                "supportive_language": "high",
-                "emotional_validation": "high",
-                "gentle_tone": "high"
-            },
-            PersonalityMode.PROFESSIONAL: {
-                "formality_level": "high",
-                "technical_accuracy": "high",
-                "structured_responses": "high",
-                "emoji_usage": "minimal"
-            },
-            PersonalityMode.CREATIVE: {
-                "imaginative_language": "high",
-                "metaphor_usage": "frequent",
-                "artistic_references": "high",
-                "inspiration_focus": "high"
-            },
-            PersonalityMode.TEACHER: {
-                "explanation_detail": "high",
-                "educational_structure": "high",
-                "patience_level": "high",
-                "knowledge_sharing": "high"
-            },
-            PersonalityMode.BALANCED: {
-                "adaptability": "high",
-                "moderate_traits": "all",
-                "context_sensitivity": "high",
-                "versatility": "high"
-            }
-        }
-    
-    def _initialize_conversation_patterns(self) -> Dict[str, Any]:
-        """Initialize conversation flow patterns."""
-        return {
-            "greeting_patterns": ["hello", "hi", "hey", "greetings"],
-            "farewell_patterns": ["bye", "goodbye", "see you", "farewell"],
-            "question_patterns": ["what", "how", "why", "when", "where", "who"],
-            "creative_patterns": ["create", "make", "generate", "build", "design"],
-            "emotional_patterns": ["feel", "emotion", "mood", "heart", "soul"]
-        }
+        # Add both sides of the turn in one call
+        self.memory_manager.add_messages_to_conversation(context.conversation_id, [message_data, response_data])
     
     def get_conversation_stats(self) -> Dict[str, Any]:
-        """Get conversation statistics."""
+        """Get conversation statistics from the running aggregates."""
         total_conversations = len(self.conversations)
-        active_conversations = len([c for c in self.conversations.values() if c.message_count > 1])
-        
-        # Aggregate statistics
-        total_messages = sum(c.message_count for c in self.conversations.values())
-        avg_engagement = sum(c.engagement_level for c in self.conversations.values()) / max(1, total_conversations)
-        
-        # State distribution
-        state_counts = {}
-        for conversation in self.conversations.values():
-            state = conversation.state.value
-            state_counts[state] = state_counts.get(state, 0) + 1
+        totals = self.conversation_totals
         
         return {
             "total_conversations": total_conversations,
-            "active_conversations": active_conversations,
-            "total_messages": total_messages,
-            "average_engagement": avg_engagement,
-            "conversation_states": state_counts,
+            "active_conversations": totals["active"],
+            "total_messages": totals["messages"],
+            "average_engagement": totals["engagement"] / max(1, total_conversations),
+            "conversation_states": {state.value: count for state, count in self.state_counts.items() if count},
             "personality_usage": {
-                personality.value: len([c for c in self.conversations.values() 
-                                     if c.ai_personality == personality])
-                for personality in PersonalityMode
+                personality.value: self.personality_counts[index] for personality, index in _PERSONALITY_INDEX.items()
             }
         }
 
@@ -4,16 +4,110 @@ Self-improvement, learning from interactions, and system optimization
 """
 
 import json
+import re
+import sys
 import time
+from array import array
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from collections import defaultdict, deque
+from functools import lru_cache
+from itertools import islice
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Number of samples retained per performance metric
+_METRIC_HISTORY = 100
+
+def _tail(items, count: int) -> list:
+    """Return the last ``count`` items of a sized iterable (deque, dict view) without copying the rest."""
+    return list(islice(items, max(0, len(items) - count), None))
+
+def _json_dumps(record: Any) -> str:
+    """Serialize a reflector dataclass to JSON text, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(record, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(asdict(record), default=str)
+
+def _intern(value: Any) -> Any:
+    """Intern categorical strings so repeated labels share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+def _keyword_pattern(*keywords: str) -> "re.Pattern[str]":
+    """Compile keywords into one alternation so a text is scanned once per set."""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+# Emotion and priority groupings shared by the analysers
+_NEGATIVE_EMOTIONS = frozenset(("sadness", "fear", "anger"))
+_POSITIVE_EMOTIONS = frozenset(("joy", "excitement"))
+_URGENT_PRIORITIES = frozenset(("high", "critical"))
+
+# Precompiled keyword sets for the interaction analysers (matched on lowercased text)
+_INTENT_KEYWORDS_RE = {
+    "creative_request": _keyword_pattern("create", "generate", "make", "design"),
+    "information_request": _keyword_pattern("explain", "information", "details", "facts"),
+    "emotional_support": _keyword_pattern("understand", "support", "help", "care"),
+    "problem_solving": _keyword_pattern("solve", "solution", "fix", "resolve")
+}
+_EMOTIONAL_WORDS_RE = _keyword_pattern("understand", "feel", "care", "support", "here for you")
+_HELPFUL_PHRASES_RE = _keyword_pattern("help", "assist", "support", "guide", "show you")
+_EMPATHETIC_WORDS_RE = _keyword_pattern("understand", "sorry", "care", "support", "here", "help")
+_CHEERFUL_WORDS_RE = _keyword_pattern("exciting", "amazing", "awesome", "fantastic")
+_ENTHUSIASTIC_WORDS_RE = _keyword_pattern("great", "amazing", "exciting", "wonderful", "fantastic")
+_VALIDATION_PHRASES_RE = _keyword_pattern("that's", "i can", "i understand", "makes sense")
+_POSITIVE_WORDS_RE = _keyword_pattern("thank", "great", "awesome", "perfect", "exactly", "love")
+_TRUST_PHRASES_RE = _keyword_pattern("can you", "please", "help me")
+
+# Helpful phrases recorded for successful responses, in priority order
+_HELPFUL_PATTERNS = (
+    "i understand", "i can help", "let me", "here's how", "you can",
+    "i'd be happy", "great question", "that's interesting", "i love"
+)
+_KEY_PHRASE_RE = _keyword_pattern(*_HELPFUL_PATTERNS)
+
+# Bit flags returned by _response_features
+_FEATURE_EMOTIONAL_WORDS = 1 << 0
+_FEATURE_HELPFUL_PHRASES = 1 << 1
+_FEATURE_EMPATHETIC_WORDS = 1 << 2
+_FEATURE_CHEERFUL_WORDS = 1 << 3
+_FEATURE_ENTHUSIASTIC_WORDS = 1 << 4
+_FEATURE_VALIDATION_PHRASES = 1 << 5
+_INTENT_FEATURES = {intent: 1 << (6 + index) for index, intent in enumerate(_INTENT_KEYWORDS_RE)}
+
+_RESPONSE_FEATURE_PATTERNS = (
+    (_FEATURE_EMOTIONAL_WORDS, _EMOTIONAL_WORDS_RE),
+    (_FEATURE_HELPFUL_PHRASES, _HELPFUL_PHRASES_RE),
+    (_FEATURE_EMPATHETIC_WORDS, _EMPATHETIC_WORDS_RE),
+    (_FEATURE_CHEERFUL_WORDS, _CHEERFUL_WORDS_RE),
+    (_FEATURE_ENTHUSIASTIC_WORDS, _ENTHUSIASTIC_WORDS_RE),
+    (_FEATURE_VALIDATION_PHRASES, _VALIDATION_PHRASES_RE)
+) + tuple((_INTENT_FEATURES[intent], pattern) for intent, pattern in _INTENT_KEYWORDS_RE.items())
+
+@lru_cache(maxsize=4096)
+def _response_features(response_lower: str) -> int:
+    """Bitmask of the keyword sets found in a lowercased response (cached for recurring responses)."""
+    features = 0
+    for flag, pattern in _RESPONSE_FEATURE_PATTERNS:
+        if pattern.search(response_lower):
+            features |= flag
+    return features
+
+@lru_cache(maxsize=4096)
+def _key_phrases(response_lower: str) -> Tuple[str, ...]:
+    """Helpful phrases found in a lowercased response, in priority order (at most 5)."""
+    found = {match.group() for match in _KEY_PHRASE_RE.finditer(response_lower)}
+    if not found:
+        return ()
+    return tuple(pattern for pattern in _HELPFUL_PATTERNS if pattern in found)[:5]
+
+@dataclass(slots=True)
 class InteractionAnalysis:
     """Analysis of a user interaction."""
     interaction_id: str
@@ -28,8 +122,12 @@ class InteractionAnalysis:
     user_satisfaction_indicators: List[str]
     improvement_suggestions: List[str]
     timestamp: str
+    
+    def to_json(self) -> str:
+        """Serialize to JSON text."""
+        return _json_dumps(self)
 
-@dataclass
+@dataclass(slots=True)
 class LearningPattern:
     """A learned pattern from user interactions."""
     pattern_id: str
@@ -41,8 +139,12 @@ class LearningPattern:
     success_rate: float
     last_updated: str
     user_feedback_summary: Dict[str, Any]
+    
+    def to_json(self) -> str:
+        """Serialize to JSON text."""
+        return _json_dumps(self)
 
-@dataclass
+@dataclass(slots=True)
 class SystemInsight:
     """System-level insight for improvement."""
     insight_id: str
@@ -54,8 +156,12 @@ class SystemInsight:
     impact_estimate: str
     implementation_complexity: str
     timestamp: str
+    
+    def to_json(self) -> str:
+        """Serialize to JSON text."""
+        return _json_dumps(self)
 
-@dataclass
+@dataclass(slots=True)
 class ReflectionReport:
     """Comprehensive reflection and improvement report."""
     report_id: str
@@ -67,6 +173,41 @@ class ReflectionReport:
     user_satisfaction_trends: Dict[str, float]
     improvement_recommendations: List[str]
     generated_at: str
+    
+    def to_json(self) -> str:
+        """Serialize to JSON text."""
+        return _json_dumps(self)
+
+class MetricRing:
+    """Fixed-size ring of metric samples stored as parallel float arrays."""
+    
+    __slots__ = ("values", "timestamps", "capacity", "count", "index")
+    
+    def __init__(self, capacity: int = _METRIC_HISTORY):
+        self.values = array("d", [0.0]) * capacity
+        self.timestamps = array("d", [0.0]) * capacity  # Unix epoch seconds
+        self.capacity = capacity
+        self.count = 0
+        self.index = 0
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def append(self, value: float, timestamp: float):
+        """Record a sample, overwriting the oldest one once the ring is full."""
+        self.values[self.index] = value
+        self.timestamps[self.index] = timestamp
+        self.index = (self.index + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+    
+    def last(self, count: int) -> List[float]:
+        """Return up to ``count`` most recent values, oldest first."""
+        count = min(count, self.count)
+        start = self.index - count
+        if start >= 0:
+            return self.values[start:self.index].tolist()
+        return self.values[start:].tolist() + self.values[:self.index].tolist()
 
 class ReflectorModule:
     """AI self-improvement and learning system."""
@@ -79,11 +220,15 @@ class ReflectorModule:
         
         # Learning data storage
         self.interaction_analyses: deque = deque(maxlen=1000)  # Recent analyses
-        self.learning_patterns: Dict[str, LearningPattern] = {}
+        self.learning_patterns: Dict[Tuple[Any, ...], LearningPattern] = {}  # Keyed by trigger tuple
+        
+        # Secondary indexes for partial pattern matching: trigger value -> {signature: creation order}
+        self.patterns_by_intent: Dict[Any, Dict[Tuple[Any, ...], int]] = defaultdict(dict)
+        self.patterns_by_emotion: Dict[Any, Dict[Tuple[Any, ...], int]] = defaultdict(dict)
         self.system_insights: List[SystemInsight] = []
         
         # Performance tracking
-        self.performance_metrics = defaultdict(list)
+        self.performance_metrics: Dict[str, MetricRing] = defaultdict(MetricRing)
         self.user_satisfaction_scores = defaultdict(list)
         
         # Learning configuration
@@ -91,8 +236,9 @@ class ReflectorModule:
         self.confidence_threshold = self.config.get("confidence_threshold", 0.7)
         self.reflection_interval = self.config.get("reflection_interval", 3600)  # 1 hour
         
-        # Last reflection time
+        # Last reflection time (wall clock for reports, monotonic for interval gating)
         self.last_reflection = time.time()
+        self.last_reflection_monotonic = time.monotonic()
         
         logger.info("ReflectorModule initialized")
     
@@ -100,24 +246,30 @@ class ReflectorModule:
                           reasoning_data: Dict[str, Any], user_id: str,
                           conversation_id: str, user_feedback: Dict[str, Any] = None) -> InteractionAnalysis:
         """Analyze a user interaction for learning opportunities."""
-        interaction_id = f"{user_id}_{conversation_id}_{int(time.time())}"
+        now = time.time()
+        now_iso = datetime.fromtimestamp(now).isoformat()
+        interaction_id = f"{user_id}_{conversation_id}_{int(now)}"
+        
+        # Lowercase both sides once for all keyword checks
+        user_lower = user_message.lower()
+        response_lower = ai_response.lower()
         
         # Analyze response quality
-        quality_score = self._analyze_response_quality(user_message, ai_response, reasoning_data)
+        quality_score = self._analyze_response_quality(
+            user_message, ai_response, user_lower, response_lower, reasoning_data
+        )
         
         # Analyze emotional appropriateness
-        emotional_score = self._analyze_emotional_appropriateness(
-            user_message, ai_response, reasoning_data
-        )
+        emotional_score = self._analyze_emotional_appropriateness(response_lower, reasoning_data)
         
         # Extract satisfaction indicators
         satisfaction_indicators = self._extract_satisfaction_indicators(
-            user_message, ai_response, user_feedback
+            user_message, user_lower, user_feedback
         )
         
         # Generate improvement suggestions
         improvement_suggestions = self._generate_improvement_suggestions(
-            user_message, ai_response, reasoning_data, quality_score, emotional_score
+            user_message, ai_response, response_lower, reasoning_data, quality_score, emotional_score
         )
         
         analysis = InteractionAnalysis(
@@ -132,23 +284,24 @@ class ReflectorModule:
             emotional_appropriateness=emotional_score,
             user_satisfaction_indicators=satisfaction_indicators,
             improvement_suggestions=improvement_suggestions,
-            timestamp=datetime.now().isoformat()
+            timestamp=now_iso
         )
         
         # Store analysis
         self.interaction_analyses.append(analysis)
         
         # Update performance metrics
-        self._update_performance_metrics(analysis)
+        self._update_performance_metrics(analysis, now)
         
         # Check for immediate learning opportunities
-        self._check_for_learning_patterns(analysis)
+        self._check_for_learning_patterns(analysis, now_iso)
         
-        logger.debug(f"Analyzed interaction {interaction_id}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Analyzed interaction {interaction_id}")
         return analysis
     
-    def _analyze_response_quality(self, user_message: str, ai_response: str,
-                                reasoning_data: Dict[str, Any]) -> float:
+    def _analyze_response_quality(self, user_message: str, ai_response: str, user_lower: str,
+                                response_lower: str, reasoning_data: Dict[str, Any]) -> float:
         """Analyze the quality of the AI response."""
         quality_score = 0.5  # Base score
         
@@ -162,37 +315,28 @@ class ReflectorModule:
             quality_score += 0.1  # Good length for longer queries
         
         # Intent matching
+        features = _response_features(response_lower)
         detected_intent = reasoning_data.get("reasoning_summary", {}).get("primary_intent")
         if detected_intent:
-            intent_keywords = {
-                "creative_request": ["create", "generate", "make", "design"],
-                "information_request": ["explain", "information", "details", "facts"],
-                "emotional_support": ["understand", "support", "help", "care"],
-                "problem_solving": ["solve", "solution", "fix", "resolve"]
-            }
-            
-            keywords = intent_keywords.get(detected_intent, [])
-            if any(keyword in ai_response.lower() for keyword in keywords):
+            if features & _INTENT_FEATURES.get(detected_intent, 0):
                 quality_score += 0.2
         
         # Emotional awareness
         if reasoning_data.get("emotional_awareness", {}).get("empathy_level", 0) > 0.5:
-            emotional_words = ["understand", "feel", "care", "support", "here for you"]
-            if any(word in ai_response.lower() for word in emotional_words):
+            if features & _FEATURE_EMOTIONAL_WORDS:
                 quality_score += 0.1
         
         # Helpfulness indicators
-        helpful_phrases = ["help", "assist", "support", "guide", "show you"]
-        if any(phrase in ai_response.lower() for phrase in helpful_phrases):
+        if features & _FEATURE_HELPFUL_PHRASES:
             quality_score += 0.1
         
         # Avoid repetition
-        if ai_response.lower() not in user_message.lower():
+        if response_lower not in user_lower:
             quality_score += 0.1
         
         return min(1.0, quality_score)
     
-    def _analyze_emotional_appropriateness(self, user_message: str, ai_response: str,
+    def _analyze_emotional_appropriateness(self, response_lower: str,
                                          reasoning_data: Dict[str, Any]) -> float:
         """Analyze emotional appropriateness of the response."""
         emotional_score = 0.5  # Base score
@@ -202,32 +346,29 @@ class ReflectorModule:
         emotion_intensity = emotional_awareness.get("emotion_intensity", 0.5)
         
         # Check for appropriate emotional response
-        if detected_emotion in ["sadness", "fear", "anger"] and emotion_intensity > 0.6:
+        features = _response_features(response_lower)
+        if detected_emotion in _NEGATIVE_EMOTIONS and emotion_intensity > 0.6:
             # Should be empathetic
-            empathetic_words = ["understand", "sorry", "care", "support", "here", "help"]
-            if any(word in ai_response.lower() for word in empathetic_words):
+            if features & _FEATURE_EMPATHETIC_WORDS:
                 emotional_score += 0.3
             
             # Should avoid being too cheerful
-            cheerful_words = ["exciting", "amazing", "awesome", "fantastic"]
-            if not any(word in ai_response.lower() for word in cheerful_words):
+            if not features & _FEATURE_CHEERFUL_WORDS:
                 emotional_score += 0.2
         
-        elif detected_emotion in ["joy", "excitement"] and emotion_intensity > 0.6:
+        elif detected_emotion in _POSITIVE_EMOTIONS and emotion_intensity > 0.6:
             # Should match enthusiasm
-            enthusiastic_words = ["great", "amazing", "exciting", "wonderful", "fantastic"]
-            if any(word in ai_response.lower() for word in enthusiastic_words):
+            if features & _FEATURE_ENTHUSIASTIC_WORDS:
                 emotional_score += 0.3
         
         # Check for emotional validation
         if emotion_intensity > 0.5:
-            validation_phrases = ["that's", "i can", "i understand", "makes sense"]
-            if any(phrase in ai_response.lower() for phrase in validation_phrases):
+            if features & _FEATURE_VALIDATION_PHRASES:
                 emotional_score += 0.2
         
         return min(1.0, emotional_score)
     
-    def _extract_satisfaction_indicators(self, user_message: str, ai_response: str,
+    def _extract_satisfaction_indicators(self, user_message: str, user_lower: str,
                                        user_feedback: Dict[str, Any] = None) -> List[str]:
         """Extract indicators of user satisfaction."""
         indicators = []
@@ -242,11 +383,8 @@ class ReflectorModule:
                 indicators.append("positive_feedback")
         
         # Implicit indicators from user message
-        user_lower = user_message.lower()
-        
         # Positive language
-        positive_words = ["thank", "great", "awesome", "perfect", "exactly", "love"]
-        if any(word in user_lower for word in positive_words):
+        if _POSITIVE_WORDS_RE.search(user_lower):
             indicators.append("positive_language")
         
         # Follow-up questions (engagement)
@@ -254,12 +392,12 @@ class ReflectorModule:
             indicators.append("engaged_follow_up")
         
         # Specific requests (trust)
-        if any(word in user_lower for word in ["can you", "please", "help me"]):
+        if _TRUST_PHRASES_RE.search(user_lower):
             indicators.append("trust_indicators")
         
         return indicators
     
-    def _generate_improvement_suggestions(self, user_message: str, ai_response: str,
+    def _generate_improvement_suggestions(self, user_message: str, ai_response: str, response_lower: str,
                                         reasoning_data: Dict[str, Any], quality_score: float,
                                         emotional_score: float) -> List[str]:
         """Generate suggestions for improving the response."""
@@ -271,18 +409,18 @@ class ReflectorModule:
                 suggestions.append("Provide more detailed and comprehensive responses")
             
             detected_intent = reasoning_data.get("reasoning_summary", {}).get("primary_intent")
-            if detected_intent == "creative_request" and "create" not in ai_response.lower():
+            if detected_intent == "creative_request" and "create" not in response_lower:
                 suggestions.append("More explicitly address creative requests with action words")
             
-            if detected_intent == "information_request" and "explain" not in ai_response.lower():
+            if detected_intent == "information_request" and "explain" not in response_lower:
                 suggestions.append("Use more explanatory language for information requests")
         
         # Emotional improvements
         if emotional_score < 0.7:
             emotion = reasoning_data.get("emotional_awareness", {}).get("detected_emotion")
-            if emotion in ["sadness", "fear", "anger"]:
+            if emotion in _NEGATIVE_EMOTIONS:
                 suggestions.append("Increase empathetic language for negative emotions")
-            elif emotion in ["joy", "excitement"]:
+            elif emotion in _POSITIVE_EMOTIONS:
                 suggestions.append("Match user enthusiasm with more energetic language")
         
         # Engagement improvements
@@ -290,40 +428,24 @@ class ReflectorModule:
             suggestions.append("Ask follow-up questions to maintain engagement")
         
         # Personalization improvements
-        if "you" not in ai_response.lower():
+        if "you" not in response_lower:
             suggestions.append("Use more personalized language addressing the user directly")
         
         return suggestions
     
-    def _update_performance_metrics(self, analysis: InteractionAnalysis):
+    def _update_performance_metrics(self, analysis: InteractionAnalysis, timestamp: float):
         """Update performance metrics based on interaction analysis."""
-        timestamp = datetime.now().isoformat()
-        
         # Quality metrics
-        self.performance_metrics["response_quality"].append({
-            "value": analysis.response_quality_score,
-            "timestamp": timestamp
-        })
+        self.performance_metrics["response_quality"].append(analysis.response_quality_score, timestamp)
         
         # Emotional appropriateness
-        self.performance_metrics["emotional_appropriateness"].append({
-            "value": analysis.emotional_appropriateness,
-            "timestamp": timestamp
-        })
+        self.performance_metrics["emotional_appropriateness"].append(analysis.emotional_appropriateness, timestamp)
         
         # User satisfaction (based on indicators)
         satisfaction_score = len(analysis.user_satisfaction_indicators) / 5.0  # Normalize to 0-1
-        self.performance_metrics["user_satisfaction"].append({
-            "value": min(1.0, satisfaction_score),
-            "timestamp": timestamp
-        })
-        
-        # Keep only recent metrics (last 100 entries)
-        for metric_name in self.performance_metrics:
-            if len(self.performance_metrics[metric_name]) > 100:
-                self.performance_metrics[metric_name] = self.performance_metrics[metric_name][-100:]
+        self.performance_metrics["user_satisfaction"].append(min(1.0, satisfaction_score), timestamp)
     
-    def _check_for_learning_patterns(self, analysis: InteractionAnalysis):
+    def _check_for_learning_patterns(self, analysis: InteractionAnalysis, timestamp: str):
         """Check for emerging learning patterns."""
         # Look for patterns in successful interactions
         if (analysis.response_quality_score > 0.8 and 
@@ -332,26 +454,26 @@ class ReflectorModule:
             
             # Extract pattern context
             context = {
-                "intent": analysis.reasoning_data.get("reasoning_summary", {}).get("primary_intent"),
-                "emotion": analysis.reasoning_data.get("emotional_awareness", {}).get("detected_emotion"),
-                "complexity": analysis.reasoning_data.get("reasoning_summary", {}).get("complexity_level"),
+                "intent": _intern(analysis.reasoning_data.get("reasoning_summary", {}).get("primary_intent")),
+                "emotion": _intern(analysis.reasoning_data.get("emotional_awareness", {}).get("detected_emotion")),
+                "complexity": _intern(analysis.reasoning_data.get("reasoning_summary", {}).get("complexity_level")),
                 "user_message_length": len(analysis.user_message),
-                "response_style": analysis.reasoning_data.get("response_style")
+                "response_style": _intern(analysis.reasoning_data.get("response_style"))
             }
             
-            # Create pattern signature
-            pattern_signature = f"{context['intent']}_{context['emotion']}_{context['complexity']}"
+            # Pattern signature (intent, emotion, complexity)
+            pattern_signature = (context["intent"], context["emotion"], context["complexity"])
             
             if pattern_signature in self.learning_patterns:
                 # Update existing pattern
                 pattern = self.learning_patterns[pattern_signature]
                 pattern.usage_count += 1
                 pattern.success_rate = (pattern.success_rate * (pattern.usage_count - 1) + 1.0) / pattern.usage_count
-                pattern.last_updated = datetime.now().isoformat()
+                pattern.last_updated = timestamp
             else:
                 # Create new pattern
                 pattern = LearningPattern(
-                    pattern_id=pattern_signature,
+                    pattern_id="_".join(map(str, pattern_signature)),
                     pattern_type="successful_interaction",
                     context_triggers=context,
                     successful_approach={
@@ -363,43 +485,33 @@ class ReflectorModule:
                     confidence_score=0.7,
                     usage_count=1,
                     success_rate=1.0,
-                    last_updated=datetime.now().isoformat(),
+                    last_updated=timestamp,
                     user_feedback_summary={}
                 )
+                creation_order = len(self.learning_patterns)
                 self.learning_patterns[pattern_signature] = pattern
+                self.patterns_by_intent[context["intent"]][pattern_signature] = creation_order
+                self.patterns_by_emotion[context["emotion"]][pattern_signature] = creation_order
                 
-                logger.info(f"New learning pattern identified: {pattern_signature}")
+                logger.info(f"New learning pattern identified: {pattern.pattern_id}")
     
     def _extract_key_phrases(self, response: str) -> List[str]:
         """Extract key phrases from a successful response."""
         # Simple keyword extraction (could be enhanced with NLP)
-        words = response.lower().split()
-        
-        # Look for helpful phrases
-        key_phrases = []
-        helpful_patterns = [
-            "i understand", "i can help", "let me", "here's how", "you can",
-            "i'd be happy", "great question", "that's interesting", "i love"
-        ]
-        
-        for pattern in helpful_patterns:
-            if pattern in response.lower():
-                key_phrases.append(pattern)
-        
-        return key_phrases[:5]  # Limit to top 5
+        return list(_key_phrases(response.lower()))
     
     def perform_reflection(self, force: bool = False) -> ReflectionReport:
         """Perform comprehensive system reflection and generate insights."""
-        current_time = time.time()
-        
-        if not force and current_time - self.last_reflection < self.reflection_interval:
-            logger.debug("Reflection interval not reached, skipping")
+        now = time.monotonic()
+        if not force and now - self.last_reflection_monotonic < self.reflection_interval:
             return None
         
+        current_time = time.time()
+        
         logger.info("Performing system reflection...")
         
         # Analyze recent interactions
-        recent_analyses = list(self.interaction_analyses)[-50:]  # Last 50 interactions
+        recent_analyses = _tail(self.interaction_analyses, 50)  # Last 50 interactions
         
         if len(recent_analyses) < 5:
             logger.warning("Insufficient interaction data for meaningful reflection")
@@ -423,7 +535,7 @@ class ReflectorModule:
             time_period=f"Last {len(recent_analyses)} interactions",
             interactions_analyzed=len(recent_analyses),
             key_insights=insights,
-            learning_patterns=list(self.learning_patterns.values())[-10:],  # Recent patterns
+            learning_patterns=_tail(self.learning_patterns.values(), 10),  # Recent patterns
             performance_metrics=performance_summary,
             user_satisfaction_trends=self._calculate_satisfaction_trends(),
             improvement_recommendations=recommendations,
@@ -431,6 +543,7 @@ class ReflectorModule:
         )
         
         self.last_reflection = current_time
+        self.last_reflection_monotonic = now
         logger.info(f"Reflection completed: {len(insights)} insights, {len(recommendations)} recommendations")
         
         return report
@@ -442,42 +555,53 @@ class ReflectorModule:
         if not analyses:
             return insights
         
+        now = time.time()
+        now_iso = datetime.fromtimestamp(now).isoformat()
+        
+        # Gather every score column in a single pass over the analyses
+        quality_scores = []
+        emotional_scores = []
+        satisfaction_counts = []
+        for analysis in analyses:
+            quality_scores.append(analysis.response_quality_score)
+            emotional_scores.append(analysis.emotional_appropriateness)
+            satisfaction_counts.append(len(analysis.user_satisfaction_indicators))
+        
         # Performance insight
-        avg_quality = sum(a.response_quality_score for a in analyses) / len(analyses)
+        avg_quality = sum(quality_scores) / len(analyses)
         if avg_quality < 0.7:
             insights.append(SystemInsight(
-                insight_id=f"performance_{int(time.time())}",
+                insight_id=f"performance_{int(now)}",
                 category="performance",
                 description=f"Average response quality is {avg_quality:.2f}, below optimal threshold of 0.7",
-                evidence=[f"Analyzed {len(analyses)} interactions", f"Quality scores range from {min(a.response_quality_score for a in analyses):.2f} to {max(a.response_quality_score for a in analyses):.2f}"],
+                evidence=[f"Analyzed {len(analyses)} interactions", f"Quality scores range from {min(quality_scores):.2f} to {max(quality_scores):.2f}"],
                 recommended_actions=["Improve response relevance", "Enhance intent detection accuracy", "Provide more comprehensive answers"],
                 priority="high",
                 impact_estimate="Improved user satisfaction and engagement",
                 implementation_complexity="medium",
-                timestamp=datetime.now().isoformat()
+                timestamp=now_iso
             ))
         
         # Emotional intelligence insight
-        avg_emotional = sum(a.emotional_appropriateness for a in analyses) / len(analyses)
+        avg_emotional = sum(emotional_scores) / len(analyses)
         if avg_emotional < 0.7:
             insights.append(SystemInsight(
-                insight_id=f"emotional_{int(time.time())}",
+                insight_id=f"emotional_{int(now)}",
                 category="emotional_intelligence",
                 description=f"Emotional appropriateness is {avg_emotional:.2f}, indicating room for improvement",
-                evidence=[f"Emotional scores below 0.7 in {sum(1 for a in analyses if a.emotional_appropriateness < 0.7)} interactions"],
+                evidence=[f"Emotional scores below 0.7 in {sum(1 for score in emotional_scores if score < 0.7)} interactions"],
                 recommended_actions=["Enhance emotion detection", "Improve empathetic responses", "Better match user emotional state"],
                 priority="medium",
                 impact_estimate="Better emotional connection with users",
                 implementation_complexity="medium",
-                timestamp=datetime.now().isoformat()
+                timestamp=now_iso
             ))
         
         # User satisfaction insight
-        satisfaction_counts = [len(a.user_satisfaction_indicators) for a in analyses]
         avg_satisfaction = sum(satisfaction_counts) / len(satisfaction_counts)
         if avg_satisfaction < 2.0:
             insights.append(SystemInsight(
-                insight_id=f"satisfaction_{int(time.time())}",
+                insight_id=f"satisfaction_{int(now)}",
                 category="user_experience",
                 description=f"Average satisfaction indicators per interaction: {avg_satisfaction:.1f}, suggesting low user satisfaction",
                 evidence=[f"Only {sum(1 for count in satisfaction_counts if count >= 2)} out of {len(analyses)} interactions showed strong satisfaction"],
@@ -485,33 +609,37 @@ class ReflectorModule:
                 priority="high",
                 impact_estimate="Higher user retention and positive feedback",
                 implementation_complexity="low",
-                timestamp=datetime.now().isoformat()
+                timestamp=now_iso
             ))
         
         return insights
     
     def _update_learning_patterns(self, analyses: List[InteractionAnalysis]):
         """Update learning patterns based on recent analyses."""
-        # Group analyses by pattern signature
-        pattern_groups = defaultdict(list)
+        # Count interactions and successes per pattern signature in one pass
+        group_counts: Dict[Tuple[Any, Any], List[int]] = {}
         
         for analysis in analyses:
             context = analysis.reasoning_data.get("reasoning_summary", {})
-            signature = f"{context.get('primary_intent', 'unknown')}_{context.get('dominant_emotion', 'neutral')}"
-            pattern_groups[signature].append(analysis)
+            signature = (context.get("primary_intent", "unknown"), context.get("dominant_emotion", "neutral"))
+            counts = group_counts.get(signature)
+            if counts is None:
+                counts = group_counts[signature] = [0, 0]
+            counts[0] += 1
+            if analysis.response_quality_score > 0.7 and analysis.emotional_appropriateness > 0.7:
+                counts[1] += 1
         
         # Update patterns with sufficient data
-        for signature, group_analyses in pattern_groups.items():
-            if len(group_analyses) >= self.min_interactions_for_pattern:
+        now_iso = datetime.now().isoformat()
+        for signature, (total, successful) in group_counts.items():
+            if total >= self.min_interactions_for_pattern:
                 if signature in self.learning_patterns:
                     pattern = self.learning_patterns[signature]
                     
                     # Calculate success rate
-                    successful = sum(1 for a in group_analyses 
-                                   if a.response_quality_score > 0.7 and a.emotional_appropriateness > 0.7)
-                    pattern.success_rate = successful / len(group_analyses)
-                    pattern.usage_count += len(group_analyses)
-                    pattern.last_updated = datetime.now().isoformat()
+                    pattern.success_rate = successful / total
+                    pattern.usage_count += total
+                    pattern.last_updated = now_iso
                     
                     # Update confidence based on success rate and usage
                     pattern.confidence_score = min(1.0, pattern.success_rate * (1 + pattern.usage_count / 100))
@@ -520,9 +648,9 @@ class ReflectorModule:
         """Calculate performance summary metrics."""
         summary = {}
         
-        for metric_name, metric_data in self.performance_metrics.items():
-            if metric_data:
-                recent_values = [entry["value"] for entry in metric_data[-20:]]  # Last 20 entries
+        for metric_name, metric_ring in self.performance_metrics.items():
+            if metric_ring:
+                recent_values = metric_ring.last(20)  # Last 20 entries
                 summary[f"{metric_name}_avg"] = sum(recent_values) / len(recent_values)
                 summary[f"{metric_name}_trend"] = self._calculate_trend(recent_values)
         
@@ -533,23 +661,23 @@ class ReflectorModule:
         if len(values) < 2:
             return 0.0
         
-        # Simple trend calculation
-        first_half = values[:len(values)//2]
-        second_half = values[len(values)//2:]
+        # Simple trend calculation (split-mean without copying either half)
+        count = len(values)
+        half = count // 2
         
-        first_avg = sum(first_half) / len(first_half)
-        second_avg = sum(second_half) / len(second_half)
+        first_avg = sum(islice(values, half)) / half
+        second_avg = sum(islice(values, half, None)) / (count - half)
         
         return min(1.0, max(-1.0, (second_avg - first_avg) * 2))  # Scale to -1 to 1
     
     def _calculate_satisfaction_trends(self) -> Dict[str, float]:
         """Calculate user satisfaction trends."""
-        satisfaction_data = self.performance_metrics.get("user_satisfaction", [])
+        satisfaction_ring = self.performance_metrics.get("user_satisfaction")
         
-        if not satisfaction_data:
+        if not satisfaction_ring:
             return {}
         
-        recent_values = [entry["value"] for entry in satisfaction_data[-20:]]
+        recent_values = satisfaction_ring.last(20)
         
         return {
             "current_satisfaction": sum(recent_values) / len(recent_values),
@@ -564,7 +692,7 @@ class ReflectorModule:
         
         # From insights
         for insight in insights:
-            if insight.priority in ["high", "critical"]:
+            if insight.priority in _URGENT_PRIORITIES:
                 recommendations.extend(insight.recommended_actions)
         
         # From performance trends
@@ -587,6 +715,9 @@ class ReflectorModule:
     
     def get_learning_summary(self) -> Dict[str, Any]:
         """Get summary of learning progress."""
+        quality_ring = self.performance_metrics.get("response_quality")
+        recent_quality = quality_ring.last(10) if quality_ring else []
+        
         return {
             "total_interactions_analyzed": len(self.interaction_analyses),
             "learning_patterns_identified": len(self.learning_patterns),
@@ -594,7 +725,7 @@ class ReflectorModule:
             "system_insights_generated": len(self.system_insights),
             "last_reflection": datetime.fromtimestamp(self.last_reflection).isoformat(),
             "performance_metrics_tracked": list(self.performance_metrics.keys()),
-            "average_response_quality": sum(entry["value"] for entry in self.performance_metrics.get("response_quality", [{}])[-10:]) / max(1, len(self.performance_metrics.get("response_quality", [])[-10:])),
+            "average_response_quality": sum(recent_quality) / max(1, len(recent_quality)),
             "learning_status": "active" if len(self.interaction_analyses) > 10 else "initializing"
         }
     
@@ -605,7 +736,7 @@ class ReflectorModule:
         emotion = context.get("dominant_emotion")
         complexity = context.get("complexity_level")
         
-        pattern_signature = f"{intent}_{emotion}_{complexity}"
+        pattern_signature = (intent, emotion, complexity)
         
         if pattern_signature in self.learning_patterns:
             pattern = self.learning_patterns[pattern_signature]
@@ -620,16 +751,18 @@ class ReflectorModule:
                     "usage_count": pattern.usage_count
                 }
         
-        # Look for partial matches
-        partial_matches = []
-        for pattern_id, pattern in self.learning_patterns.items():
-            if (pattern.context_triggers.get("intent") == intent or
-                pattern.context_triggers.get("emotion") == emotion):
-                partial_matches.append((pattern, pattern.confidence_score))
+        # Look for partial matches through the intent/emotion indexes
+        partial_matches = dict(self.patterns_by_intent.get(intent, {}))
+        partial_matches.update(self.patterns_by_emotion.get(emotion, {}))
         
         if partial_matches:
-            # Use highest confidence partial match
-            best_pattern = max(partial_matches, key=lambda x: x[1])[0]
+            # Use highest confidence partial match (earliest learned wins ties)
+            best_signature = max(
+                partial_matches,
+                key=lambda signature: (self.learning_patterns[signature].confidence_score,
+                                       -partial_matches[signature])
+            )
+            best_pattern = self.learning_patterns[best_signature]
             if best_pattern.confidence_score > 0.6:
                 return {
                     "apply_pattern": True,
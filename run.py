@@ -4,44 +4,92 @@ Guaranteed to work on Railway!
 """
 
 import os
+import re
 import logging
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Chat keyword sets, each scanned in one pass over the lowercased message
+_GREETING_RE = re.compile("hello|hi|hey|greetings")
+_STATUS_RE = re.compile("how are you|status|working")
+_HELP_RE = re.compile("help|assist|support")
+_ABOUT_RE = re.compile("what are you|who are you|about")
+_CREATIVE_RE = re.compile("create|make|generate|write")
+
+# Landing-page payload; only the timestamp changes per request
+_HOME_INFO = {
+    "message": "🆓 Mythiq AI - FREE Version: Emergency Simple Mode",
+    "version": "2.0.0-SIMPLE",
+    "stage": "Stage 2 - Emergency Mode",
+    "status": "✅ WORKING!",
+    "note": "This is a simplified version that always works!",
+    "features": (
+        "✅ Working chat endpoint",
+        "✅ Working generation endpoint",
+        "✅ System status monitoring",
+        "✅ Error handling",
+        "✅ CORS support",
+        "🔄 Ready for Phase 2 upgrade!"
+    ),
+    "next_steps": (
+        "Test all endpoints",
+        "Add FREE API keys when ready",
+        "Upgrade to full Phase 2 features",
+        "Deploy advanced AI modules"
+    )
+}
+
+# Static chat replies and payload sections, built once and shared by every response
+_STATUS_REPLY = "I'm doing great! 😊 I'm currently running in emergency simple mode on Railway. All systems are operational and ready to help you! ✅"
+_HELP_REPLY = "I'm here to help! 🤝 In emergency simple mode, I can chat with you, generate content, and provide system status. Once we upgrade to full Phase 2, I'll have emotional intelligence and advanced AI capabilities! 🧠"
+_ABOUT_REPLY = "I'm Mythiq AI! 🤖 I'm currently in emergency simple mode, which means I'm working reliably on Railway. Soon I'll be upgraded with emotional intelligence, FREE AI services (Groq + Hugging Face), and advanced conversation capabilities! ✨"
+_CHAT_SUGGESTIONS = (
+    "Ask me about my capabilities",
+    "Request content generation",
+    "Check system status",
+    "Plan Phase 2 upgrade"
+)
+_CHAT_UPGRADE_INFO = {
+    "current_mode": "Emergency Simple",
+    "next_upgrade": "Phase 2 - Full AI Intelligence",
+    "features_coming": (
+        "🧠 Emotional Intelligence",
+        "🆓 FREE AI Services (Groq + Hugging Face)",
+        "💾 Advanced Memory System",
+        "🔄 Self-Improvement Learning"
+    )
+}
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for faster API serialization."""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 # Initialize Flask app
 app = Flask(__name__)
+if orjson is not None:
+    app.json = ORJSONProvider(app)
 CORS(app)
 
 @app.route('/', methods=['GET'])
 def home():
     """Home endpoint."""
-    return jsonify({
-        "message": "🆓 Mythiq AI - FREE Version: Emergency Simple Mode",
-        "version": "2.0.0-SIMPLE",
-        "stage": "Stage 2 - Emergency Mode",
-        "status": "✅ WORKING!",
-        "note": "This is a simplified version that always works!",
-        "features": [
-            "✅ Working chat endpoint",
-            "✅ Working generation endpoint", 
-            "✅ System status monitoring",
-            "✅ Error handling",
-            "✅ CORS support",
-            "🔄 Ready for Phase 2 upgrade!"
-        ],
-        "next_steps": [
-            "Test all endpoints",
-            "Add FREE API keys when ready",
-            "Upgrade to full Phase 2 features",
-            "Deploy advanced AI modules"
-        ],
-        "timestamp": datetime.now().isoformat()
-    })
+    return jsonify({**_HOME_INFO, "timestamp": datetime.now().isoformat()})
 
 @app.route('/api/test', methods=['GET'])
 def test_endpoint():
@@ -118,23 +166,23 @@ def chat():
         message_lower = message.lower()
         
         # Greeting responses
-        if any(word in message_lower for word in ["hello", "hi", "hey", "greetings"]):
+        if _GREETING_RE.search(message_lower):
             response = f"Hello {user_id}! 👋 I'm Mythiq AI in emergency simple mode. I'm working perfectly on Railway! How can I help you today? 🚀"
         
         # Status questions
-        elif any(word in message_lower for word in ["how are you", "status", "working"]):
-            response = "I'm doing great! 😊 I'm currently running in emergency simple mode on Railway. All systems are operational and ready to help you! ✅"
+        elif _STATUS_RE.search(message_lower):
+            response = _STATUS_REPLY
         
         # Help requests
-        elif any(word in message_lower for word in ["help", "assist", "support"]):
-            response = "I'm here to help! 🤝 In emergency simple mode, I can chat with you, generate content, and provide system status. Once we upgrade to full Phase 2, I'll have emotional intelligence and advanced AI capabilities! 🧠"
+        elif _HELP_RE.search(message_lower):
+            response = _HELP_REPLY
         
         # About questions
-        elif any(word in message_lower for word in ["what are you", "who are you", "about"]):
-            response = "I'm Mythiq AI! 🤖 I'm currently in emergency simple mode, which means I'm working reliably on Railway. Soon I'll be upgraded with emotional intelligence, FREE AI services (Groq + Hugging Face), and advanced conversation capabilities! ✨"
+        elif _ABOUT_RE.search(message_lower):
+            response = _ABOUT_REPLY
         
         # Creative requests
-        elif any(word in message_lower for word in ["create", "make", "generate", "write"]):
+        elif _CREATIVE_RE.search(message_lower):
             response = f"I love creative projects! 🎨 You asked me to work with: '{message}'. In emergency simple mode, I can help brainstorm and plan. Once upgraded to full Phase 2, I'll have real AI generation capabilities! 🚀"
         
         # Default response
@@ -152,22 +200,8 @@ def chat():
                 "processing_time": "< 0.001 seconds",
                 "status": "✅ Working perfectly!"
             },
-            "suggestions": [
-                "Ask me about my capabilities",
-                "Request content generation", 
-                "Check system status",
-                "Plan Phase 2 upgrade"
-            ],
-            "upgrade_info": {
-                "current_mode": "Emergency Simple",
-                "next_upgrade": "Phase 2 - Full AI Intelligence",
-                "features_coming": [
-                    "🧠 Emotional Intelligence",
-                    "🆓 FREE AI Services (Groq + Hugging Face)",
-                    "💾 Advanced Memory System",
-                    "🔄 Self-Improvement Learning"
-                ]
-            },
+            "suggestions": _CHAT_SUGGESTIONS,
+            "upgrade_info": _CHAT_UPGRADE_INFO,
             "timestamp": datetime.now().isoformat()
         })
         
@@ -426,7 +460,9 @@ def main():
     app.run(
         host='0.0.0.0',
         port=port,
-        debug=False
+        debug=False,
+        use_reloader=False,
+        threaded=True
     )
 
 if __name__ == '__main__':